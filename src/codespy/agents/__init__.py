@@ -1,6 +1,7 @@
 """Agents module - shared utilities and agent implementations."""
 
 from codespy.agents.cost_tracker import (
+    CostProbe,
     CostTracker,
     SignatureContext,
     SignatureStats,
@@ -12,6 +13,7 @@ from codespy.agents.dspy_config import (
 )
 
 __all__ = [
+    "CostProbe",
     "CostTracker",
     "SignatureContext",
     "SignatureStats",
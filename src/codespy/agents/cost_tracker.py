@@ -7,7 +7,7 @@ even during parallel execution with dspy.Parallel.
 import threading
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
 import dspy  # type: ignore[import-untyped]
 
@@ -246,6 +246,38 @@ class SignatureContext:
         self.__exit__(exc_type, exc_val, exc_tb)
 
 
+class CostProbe:
+    """Collects the LM calls made by one specific module call.
+
+    The global LM history mixes calls from every module running concurrently.
+    DSPy also appends each history entry to every module on its caller stack,
+    so placing a probe on that stack records exactly the calls made beneath it.
+
+    Usage:
+        probe = CostProbe()
+        with probe.attach():
+            result = await agent.acall(...)
+        spent = probe.cost
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty probe."""
+        # Appended to by DSPy for each LM call made while attached
+        self.history: list[dict[str, Any]] = []
+
+    def attach(self) -> Any:
+        """Context manager placing the probe on DSPy's caller-module stack."""
+        caller_modules = list(dspy.settings.caller_modules or [])
+        caller_modules.append(self)
+        return dspy.context(caller_modules=caller_modules)
+
+    @property
+    def cost(self) -> float:
+        """Cost in USD of the LM calls recorded so far."""
+        cost, _, _ = _calculate_costs_from_entries(self.history, set())
+        return cost
+
+
 # Global cost tracker instance
 _cost_tracker = CostTracker()
 
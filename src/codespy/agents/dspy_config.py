@@ -1,6 +1,7 @@
 """DSPy and LiteLLM configuration utilities."""
 
 import logging
+from typing import Any
 
 import dspy  # type: ignore[import-untyped]
 from dspy.adapters.two_step_adapter import TwoStepAdapter  # type: ignore[import-untyped]
@@ -20,7 +21,7 @@ def configure_dspy(settings: Settings) -> None:
       * Stage 2: Extraction LM extracts structured fields from free-form response
     - Global timeout and retries for reliability
     - Provider-side prompt caching (when enabled)
-    - Memory caching for LLM responses
+    - Memory caching for LLM responses (plus disk caching when enabled)
 
     TwoStepAdapter decouples reasoning quality from format compliance,
     solving ChatAdapter parsing failures with ReAct agents.
@@ -53,10 +54,14 @@ def configure_dspy(settings: Settings) -> None:
 
     # Enable provider-side prompt caching if configured
     # This caches system prompts on the LLM provider's servers (Anthropic, OpenAI, Bedrock, etc.)
+    # The system message carries the static signature instructions, so it is
+    # byte-identical across scopes and ReAct turns; per-call inputs follow it.
+    cache_kwargs: dict[str, Any] = {}
     if settings.enable_prompt_caching:
-        lm_kwargs["cache_control_injection_points"] = [
+        cache_kwargs["cache_control_injection_points"] = [
             {"location": "message", "role": "system"}
         ]
+    lm_kwargs.update(cache_kwargs)
 
     # Configure DSPy with LiteLLM and TwoStepAdapter
     lm = dspy.LM(**lm_kwargs)
@@ -65,10 +70,12 @@ def configure_dspy(settings: Settings) -> None:
     # Uses a smaller/faster model to extract structured fields from free-form responses
     # Falls back to default_model if no extraction_model is configured
     extraction_model = settings.extraction_model or settings.default_model
+    # The extraction prompt is also static per signature, so cache its prefix too
     extraction_lm = dspy.LM(
         model=extraction_model,
         timeout=settings.llm_timeout,
         num_retries=settings.llm_retries,
+        **cache_kwargs,
     )
 
     dspy.settings.configure(
@@ -76,8 +83,24 @@ def configure_dspy(settings: Settings) -> None:
         adapter=TwoStepAdapter(extraction_lm),  # TwoStepAdapter solves ChatAdapter parsing failures
     )
 
-    # Enable memory-only caching for LLM calls (no disk caching)
-    dspy.configure_cache(enable_memory_cache=True, enable_disk_cache=False, memory_max_entries=10000)
+    # Enable memory caching for LLM calls, plus an optional disk cache so re-reviews
+    # (re-pushes, CI retries) of identical prompts skip the LLM entirely. DSPy keys
+    # entries on the full request (model, signature prompt, inputs).
+    if settings.enable_llm_disk_cache:
+        llm_cache_dir = settings.cache_dir / "llm"
+        llm_cache_dir.mkdir(parents=True, exist_ok=True)
+        dspy.configure_cache(
+            enable_memory_cache=True,
+            enable_disk_cache=True,
+            disk_cache_dir=str(llm_cache_dir),
+            memory_max_entries=10000,
+        )
+    else:
+        dspy.configure_cache(
+            enable_memory_cache=True,
+            enable_disk_cache=False,
+            memory_max_entries=10000,
+        )
 
     prompt_cache_status = "enabled" if settings.enable_prompt_caching else "disabled"
     logger.info(
@@ -16,6 +16,21 @@ class IssueSeverity(str, Enum):
     LOW = "low"
     INFO = "info"
 
+    @property
+    def priority(self) -> int:
+        """Numeric priority for ordering (higher = more severe)."""
+        return _SEVERITY_PRIORITY[self]
+
+
+# Severity priority (higher number = higher priority)
+_SEVERITY_PRIORITY = {
+    IssueSeverity.INFO: 1,
+    IssueSeverity.LOW: 2,
+    IssueSeverity.MEDIUM: 3,
+    IssueSeverity.HIGH: 4,
+    IssueSeverity.CRITICAL: 5,
+}
+
 
 class IssueCategory(str, Enum):
     """Category of an issue."""
@@ -1,139 +1,391 @@
 """Merged code defect detection and documentation review module."""
 
 import asyncio
+import hashlib
 import logging
+import os
+import re
+import shutil
+from collections import Counter
 from pathlib import Path
 from typing import Any, Sequence
 
 import dspy  # type: ignore[import-untyped]
+from cachetools import LRUCache
 
-from codespy.agents import SignatureContext, get_cost_tracker
+from codespy.agents import CostProbe, SignatureContext, get_cost_tracker
 from codespy.agents.reviewer.models import Issue, IssueCategory, ScopeResult
-from codespy.agents.reviewer.modules.helpers import MIN_CONFIDENCE, make_scope_relative, resolve_scope_root, restore_repo_paths
+from codespy.agents.reviewer.modules.helpers import (
+    MIN_CONFIDENCE,
+    TOOLS_DIR,
+    BackgroundLoop,
+    is_trivial_patch,
+    make_scope_relative,
+    resolve_scope_root,
+    restore_repo_paths,
+)
 from codespy.config import get_settings
-from codespy.tools.mcp_utils import cleanup_mcp_contexts, connect_mcp_server
+from codespy.tools.filesystem.client import FileSystem
+from codespy.tools.mcp_utils import MCPToolPool, connect_mcp_server
 
 logger = logging.getLogger(__name__)
 
+# Files whose diffs are never worth an agent run (vendored, built, or generated)
+GENERATED_FILE_RE = re.compile(
+    r"(^|/)(vendor|node_modules|dist|generated)/"
+    r"|\.lock$|\.min\.(js|css)$|_pb2(_grpc)?\.py$|\.pb\.go$"
+)
+
+# Files that never change documented behavior: tests, and private modules or
+# packages (a path component with a leading underscore, dunder files excepted)
+DOC_IRRELEVANT_FILE_RE = re.compile(
+    r"(^|/)(tests?|__tests__|testdata|spec)/"
+    r"|(^|/)test_[^/]*\.py$|_test\.(py|go)$|\.(test|spec)\.[cm]?[jt]sx?$"
+    r"|Tests?\.(java|kt|swift|cs)$"
+    r"|(^|/)_(?!_)[^/]*(/|\.py$)"
+)
+
+# Names declared on changed diff lines (functions, methods, types, classes);
+# Go receivers like "func (s *Server) Name" are skipped
+ENTITY_NAME_RE = re.compile(
+    r"^[+-]\s*(?:export\s+)?(?:pub\s+)?(?:async\s+)?"
+    r"(?:def|func|fn|class|type|interface)\s+(?:\([^)]*\)\s*)?([A-Za-z_]\w{2,})",
+    re.MULTILINE,
+)
+
+# Reference pre-search: names searched per scope, shortest name searched, files
+# kept per name, total characters of paths passed to the prompt, marker ending
+# a truncated file list, doc globs (code references search everything else),
+# and timeout
+MAX_REFERENCE_NAMES = 50
+MIN_REFERENCE_NAME_LENGTH = 4
+MAX_REFERENCE_FILES = 20
+MAX_REFERENCE_CHARS = 4_000
+REFERENCE_TRUNCATED = "…"
+DOC_REFERENCE_GLOBS = ("*.md", "*.markdown", "*.mdx", "*.rst", "*.adoc", "*.txt")
+CODE_REFERENCE_GLOBS = tuple(f"!{glob}" for glob in DOC_REFERENCE_GLOBS)
+REFERENCE_TIMEOUT = 10
+
+# Documentation presence check: doc file extensions, doc file/directory name
+# prefixes (lowercased), and how many directory levels below the scope root to scan
+DOC_EXTENSIONS = (".md", ".markdown", ".mdx", ".rst", ".adoc")
+DOC_NAME_PREFIXES = ("readme", "changelog", ".env.example", "docs", "documentation")
+DOC_SCAN_DEPTH = 2
+
+# README preloaded into the agent input: candidate names at the scope root (first
+# match wins) and the character cap
+README_NAMES = ("README.md", "readme.md", "README.rst", "README")
+README_MAX_CHARS = 12_000
+
+# Scope directory tree preloaded into the agent input: depth and character cap
+SCOPE_TREE_DEPTH = 2
+SCOPE_TREE_MAX_CHARS = 4_000
+
+# Number of per-scope review results kept for identical scopes within a run
+RESULT_CACHE_SIZE = 256
+
+# Scope-rooted MCP servers:
+# - filesystem: read_file, list_directory, get_tree, file_exists, get_file_info
+# - ripgrep: search_literal, find_function_usages, find_type_usages, etc.
+# - treesitter: find_function_definitions, find_function_calls, etc.
+MCP_SERVERS = (
+    TOOLS_DIR / "filesystem" / "server.py",
+    TOOLS_DIR / "parsers" / "ripgrep" / "server.py",
+    TOOLS_DIR / "parsers" / "treesitter" / "server.py",
+)
+
+# Per-scope ReAct iteration budget: BASE_ITERS + ITERS_PER_FILE * changed files,
+# always capped by the configured max_iters
+BASE_ITERS = 6
+ITERS_PER_FILE = 2
+
+# Client-side cache policy for read-only MCP tools, keyed by tool name:
+# - "args": cache on the call arguments for the duration of the run
+# - "mtime": also key on the target path's modification time
+# Tools not listed here are never cached.
+TOOL_CACHE_POLICY: dict[str, str] = {
+    "search_literal": "args",
+    "find_function_usages": "args",
+    "find_type_usages": "args",
+    "find_imports_of": "args",
+    "find_callers": "args",
+    "find_function_definitions": "args",
+    "find_function_calls": "args",
+    "find_all_calls_in_file": "args",
+    "read_file": "mtime",
+    "list_directory": "mtime",
+}
+
+
+def _is_reviewable(scope: ScopeResult) -> bool:
+    """Check if a scope has at least one substantive change worth an agent run.
+
+    A file counts as substantive unless it matches GENERATED_FILE_RE or its
+    patch is trivial (blank or comment-only changes, see is_trivial_patch).
+    Files without a patch (e.g., too large for the platform diff API) are
+    kept, since their changes cannot be judged from the diff.
+    """
+    for f in scope.changed_files:
+        if GENERATED_FILE_RE.search(f.filename):
+            continue
+        if f.patch is None or not is_trivial_patch(f.patch, f.extension):
+            return True
+    return False
+
+
+def _has_doc_relevant_change(scope: ScopeResult) -> bool:
+    """Check if a scope's changes may require documentation updates.
+
+    Deliberately conservative: any change can alter documented behavior
+    (defaults, status codes, config fields, struct tags), so only scopes whose
+    changed files all match DOC_IRRELEVANT_FILE_RE (tests and private modules)
+    are excluded.
+    """
+    return not all(DOC_IRRELEVANT_FILE_RE.search(f.filename) for f in scope.changed_files)
+
+
+def _scope_digest(
+    scope: ScopeResult, scope_root: Path, categories: Sequence[IssueCategory]
+) -> str:
+    """Stable digest of a scope's review input.
+
+    Covers the resolved scope root (so identical patches in different checkouts
+    differ), the review categories, and the changed file patches. Scopes with
+    the same digest within a run get the same agent input, so their review
+    results can be reused.
+    """
+    h = hashlib.blake2b(str(scope_root).encode(), digest_size=16)
+    h.update(b"\0")
+    h.update(",".join(sorted(c.value for c in categories)).encode())
+    for entry in sorted(f"{f.filename}:{f.patch}" for f in scope.changed_files):
+        h.update(b"\0")
+        h.update(entry.encode())
+    return h.hexdigest()
+
+
+def _changed_entity_names(scope: ScopeResult) -> list[str]:
+    """Collect names declared on added/removed lines, in order of first appearance.
+
+    Private names (leading underscore) and names shorter than
+    MIN_REFERENCE_NAME_LENGTH are skipped, since they match too much to be
+    useful; at most MAX_REFERENCE_NAMES are returned.
+    """
+    names: dict[str, None] = {}
+    for f in scope.changed_files:
+        for name in ENTITY_NAME_RE.findall(f.patch or ""):
+            if len(name) >= MIN_REFERENCE_NAME_LENGTH and not name.startswith("_"):
+                names[name] = None
+    return list(names)[:MAX_REFERENCE_NAMES]
+
+
+def _cap_references(
+    references: dict[str, set[str]], names: Sequence[str]
+) -> dict[str, list[str]]:
+    """Trim reference hits to MAX_REFERENCE_FILES per name and MAX_REFERENCE_CHARS total.
+
+    Names keep their search order, so once the character budget runs out the
+    later names keep no paths. Every name with hits is listed; a list cut
+    short ends with REFERENCE_TRUNCATED.
+    """
+    capped: dict[str, list[str]] = {}
+    remaining = MAX_REFERENCE_CHARS
+    for name in names:
+        paths = sorted(references.get(name, ()))
+        if not paths:
+            continue
+        kept: list[str] = []
+        for path in paths[:MAX_REFERENCE_FILES]:
+            if len(path) > remaining:
+                remaining = 0
+                break
+            kept.append(path)
+            remaining -= len(path)
+        if len(kept) < len(paths):
+            kept.append(REFERENCE_TRUNCATED)
+        capped[name] = kept
+    return capped
+
+
+async def _find_references(
+    scope_root: Path, names: Sequence[str], globs: Sequence[str]
+) -> dict[str, list[str]]:
+    """Map names to the files under scope_root that mention them.
+
+    Runs a single ripgrep pass over all names so the agent does not have to
+    search for each changed name itself. Output is read as it streams, so only
+    distinct (name, file) pairs are held. Failures (ripgrep missing, timeout,
+    errors) yield an empty map.
+
+    Args:
+        scope_root: Directory to search; returned paths are relative to it
+        names: Literal names to search for (whole words)
+        globs: ripgrep --glob filters (e.g., DOC_REFERENCE_GLOBS)
+
+    Returns:
+        Mapping of name to sorted file paths, capped by _cap_references (truncated
+        lists end with REFERENCE_TRUNCATED); names without hits are omitted
+    """
+    if not names or shutil.which("rg") is None:
+        return {}
+    cmd = ["rg", "--only-matching", "--no-heading", "--with-filename", "--no-line-number",
+           "--color=never", "--fixed-strings", "--word-regexp"]
+    for glob in globs:
+        cmd.extend(["--glob", glob])
+    for name in names:
+        cmd.extend(["-e", name])
+    cmd.append(".")
+    references: dict[str, set[str]] = {}
+
+    async def collect(process: asyncio.subprocess.Process) -> None:
+        if process.stdout is None:
+            return
+        async for line in process.stdout:
+            path, _, name = line.decode(errors="replace").rstrip("\n").rpartition(":")
+            if path:
+                references.setdefault(name, set()).add(path.removeprefix("./"))
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(scope_root),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            await asyncio.wait_for(collect(process), timeout=REFERENCE_TIMEOUT)
+            await process.wait()
+        except (TimeoutError, ValueError) as e:
+            # ValueError: an output line longer than the stream reader limit
+            process.kill()
+            await process.wait()
+            logger.debug("Reference search stopped in %s: %r", scope_root, e)
+            return {}
+    except OSError as e:
+        logger.debug("Reference search failed in %s: %s", scope_root, e)
+        return {}
+    return _cap_references(references, names)
+
+
+def _scope_has_docs(scope_root: Path) -> bool:
+    """Check if a scope root contains any documentation to check changes against.
+
+    Scans at most DOC_SCAN_DEPTH directory levels, skipping hidden directories,
+    for files with DOC_EXTENSIONS or entries named after DOC_NAME_PREFIXES.
+    """
+    pending = [(scope_root, 0)]
+    while pending:
+        directory, depth = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name.lower()
+                    if name.startswith(DOC_NAME_PREFIXES) or name.endswith(DOC_EXTENSIONS):
+                        return True
+                    if depth < DOC_SCAN_DEPTH and not name.startswith(".") and entry.is_dir():
+                        pending.append((Path(entry.path), depth + 1))
+        except OSError:
+            continue
+    return False
+
+
+def _read_readme(scope_root: Path) -> str:
+    """Read the scope README (first of README_NAMES), truncated to README_MAX_CHARS.
+
+    Returns an empty string if no README exists or it cannot be read.
+    """
+    for name in README_NAMES:
+        path = scope_root / name
+        try:
+            if path.is_file():
+                with path.open(encoding="utf-8", errors="replace") as f:
+                    content = f.read(README_MAX_CHARS + 1)
+                if len(content) > README_MAX_CHARS:
+                    content = content[:README_MAX_CHARS] + "\n... (truncated)"
+                return content
+        except OSError:
+            continue
+    return ""
+
+
+def _read_scope_tree(scope_root: Path) -> str:
+    """Render SCOPE_TREE_DEPTH levels of the scope tree, capped at SCOPE_TREE_MAX_CHARS.
+
+    Uses the same format as the filesystem get_tree tool. Returns an empty
+    string if the tree cannot be built.
+    """
+    try:
+        tree = FileSystem(scope_root, create_if_missing=False).get_tree_string("", SCOPE_TREE_DEPTH)
+    except (OSError, ValueError):
+        return ""
+    if len(tree) > SCOPE_TREE_MAX_CHARS:
+        tree = tree[:SCOPE_TREE_MAX_CHARS] + "\n... (truncated)"
+    return tree
+
+
+def _adaptive_max_iters(max_iters: int, file_count: int) -> int:
+    """Scale the ReAct iteration budget to the number of changed files in a scope.
+
+    Args:
+        max_iters: Configured maximum iterations for the signature (hard cap)
+        file_count: Number of changed files in the scope
+
+    Returns:
+        Iteration budget for the scope, never above max_iters
+    """
+    return min(max_iters, BASE_ITERS + ITERS_PER_FILE * file_count)
+
 
 class CodeAndDocReviewSignature(dspy.Signature):
     """Detect VERIFIED code defects AND stale/wrong documentation in a scope.
 
-    You are a busy Principal Engineer with very little time.
-    Be extremely terse. Use imperative mood ("Fix X", not "You should fix X").
-    You have tools to explore the scope's filesystem, search for text, and analyze code.
-    All file paths are relative to the scope root directory (the current tool root).
-    Tools are restricted to this scope — you cannot access files outside it.
-
-    ═══════════════════════════════════════════════════════════════════════════════
-    PHASE 1 — READ DOCUMENTATION (MANDATORY FIRST STEP)
-    ═══════════════════════════════════════════════════════════════════════════════
-
-    Use read_file to read the README at the scope root:
-    - Path: readme.md OR README.md (paths are relative to scope root)
-    - This file provides essential context about the scope's purpose, API contracts,
-      configuration, and expected behavior. Use it to inform BOTH documentation
-      review AND defect detection.
-
-    If README doesn't exist at scope root, search for alternative documentation files
-    (e.g., docs/, documentation/, README.rst) using get_tree or file_exists.
-
-    ═══════════════════════════════════════════════════════════════════════════════
-    PHASE 2 — ANALYZE CHANGES FOR DEFECTS AND DOCUMENTATION ISSUES
-    ═══════════════════════════════════════════════════════════════════════════════
-
-    Using the README context and the patches in scope.changed_files, look for:
-
-    ── A. CODE DEFECTS (category = "bug" or "security") ──────────────────────────
-
-    CRITICAL RULES:
-    - ONLY report defects you can VERIFY using the available tools
-    - Before reporting any defect, USE the tools to verify your assumptions
-    - DO NOT speculate about potential issues you cannot verify
-    - DO NOT report "might be", "could be", "possibly", "may cause" issues
-    - If you cannot point to the EXACT defective code with evidence, do NOT report it
-    - Quality over quantity: prefer 0 reports over 1 speculative report
-
-    VERIFICATION WORKFLOW:
-    1. Review each changed file's patch — the diff shows what changed
-    2. For suspected defects that need verification beyond the patch:
-       - Use find_function_definitions to check function signatures and implementations
-       - Use find_function_calls to understand how functions are called and trace data flow
-       - Use find_function_usages/find_callers to trace usage patterns
-       - Use search_literal to find related patterns (sanitization, encoding, validation)
-       - Use read_file ONLY if you need broader context not visible in the patch
-    3. Only report issues that are CONFIRMED by your verification
-
-    BUGS & LOGIC ERRORS (category = "bug"):
-    - Logic errors: verify the condition is actually incorrect by checking related code
-    - Null/undefined references: verify the check is actually missing
-    - Resource leaks: verify there's no cleanup in finally/defer/close methods
-    - Error handling: verify errors aren't handled elsewhere in the call chain
-    - Type mismatches: verify types by checking definitions
-    - Off-by-one errors: verify by understanding the data structure bounds
-
-    SECURITY VULNERABILITIES (category = "security"):
-    - Injection attacks (SQL, command, XSS): verify input reaches dangerous sink without sanitization
-    - Authentication/authorization issues: verify auth check is actually missing
-    - Sensitive data exposure: verify data is actually exposed, not just accessed
-    - Insecure cryptographic practices: verify the actual algorithm used
-    - Security misconfigurations: verify by checking actual config values
-    - Input validation issues: verify input is not validated
-    - Path traversal: verify path input is not sanitized
-    - Race conditions: verify shared state access without synchronization
-    - Memory safety issues: verify unsafe memory operations
-
-    DO NOT report:
-    - Style issues or minor improvements
-    - Hypothetical vulnerabilities without evidence
-    - "Could be vulnerable if..." scenarios
-
-    ── B. DOCUMENTATION ISSUES (category = "documentation") ──────────────────────
-
-    Verify documentation against the specific changes in this scope:
-
-    HTTP/API CHANGES (CRITICAL — high miss rate):
-    - Content-Type changes → check documented examples
-    - HTTP status code changes → update all references
-    - Response body structure changes → verify documented examples match
-    - New response fields → ensure documented
-    - Search docs for endpoint paths to find all examples
-
-    FUNCTION/METHOD SIGNATURE CHANGES:
-    - Parameters added/removed/renamed → check if docs reference old signatures
-    - Return type changes → update all examples
-    - New public functions → ensure documented if scope has doc conventions
-
-    CONFIGURATION & ENVIRONMENT VARIABLES:
-    - New config fields → check README Configuration section or .env.example
-    - Removed/renamed fields → search docs for old field names
-    - Default value changes → verify docs reflect new defaults
-
-    ERROR TYPES & CODES:
-    - New/removed error types → check error documentation
-    - Error behavior changes (error → success) → BREAKING, must document
-    - HTTP status code semantics change → update API docs
-
-    DATA MODELS & STRUCTS:
-    - New/removed fields in request/response structs → update API examples
-    - Field type changes → update examples
-
-    CLI COMMANDS & FLAGS:
-    - New commands/flags → add to CLI reference
-    - Removed/renamed flags → search docs for old names
-
-    ═══════════════════════════════════════════════════════════════════════════════
-    OUTPUT RULES
-    ═══════════════════════════════════════════════════════════════════════════════
-
-    - Set category to one of the values provided in the categories input
-    - For security issues, include cwe_id where applicable
-    - Reference files by name and line number only — never copy source code into issues
-    - Do not repeat patch content in reasoning steps. Keep each reasoning step to 1-2 sentences
-    - Empty list if no issues found. No approval text ("LGTM", "looks good")
-    - description: ≤25 words, imperative tone, no filler ("Fix X", "Update Y section")
-    - No polite or conversational language ("I suggest", "Please consider", "Great")
-    - Do not populate code_snippet — use line numbers instead
+    Role: busy Principal Engineer. Extremely terse, imperative mood ("Fix X").
+    Tools are rooted at the scope root; all paths are relative to it.
+
+    STEP 1: the readme input holds the scope README (do not read_file it again).
+    If empty, look for docs/, documentation/ in scope_tree. Use it as context for
+    both defect and documentation review. scope_tree is the scope layout; call
+    get_tree only for deeper paths.
+
+    STEP 2: analyze each patch in scope.changed_files.
+
+    DEFECTS (category "bug" | "security"):
+    - Report ONLY defects VERIFIED with tools, pointing to the exact code.
+      No "might/could/possibly/may" issues; 0 reports beats 1 speculative one.
+    - Verify beyond the patch with: find_function_definitions (signatures),
+      find_function_calls (data flow), find_function_usages/find_callers (usage),
+      search_literal (sanitization/validation), read_file only if needed.
+      code_references lists files known to use each changed name: a starting
+      point, not exhaustive; a list ending in "…" was truncated. Verify
+      usages that matter with the tools.
+    - bug: logic error (condition wrong), null ref (check missing), resource leak
+      (no finally/defer/close), unhandled error (not handled up the chain),
+      type mismatch (per definition), off-by-one (per bounds).
+    - security: injection (SQL/command/XSS, unsanitized input reaches sink),
+      missing authn/authz check, sensitive data actually exposed, weak crypto
+      (actual algorithm), misconfiguration (actual values), unvalidated input,
+      path traversal, race on shared state, unsafe memory ops.
+    - Skip: style, minor improvements, hypothetical "vulnerable if..." cases.
+
+    DOCUMENTATION (category "documentation", only if in categories), check docs
+    against the change. Start from doc_references (docs already known to mention
+    changed names, possibly truncated), then search docs yourself:
+    - HTTP/API (high miss rate): Content-Type, status codes, response body
+      shape, new response fields; search docs for endpoint paths.
+    - Signatures: added/removed/renamed params, return types, new public
+      functions (if the scope documents them).
+    - Config/env vars: new fields (README Configuration, .env.example),
+      renamed/removed fields, changed defaults.
+    - Errors: new/removed error types; error->success is BREAKING.
+    - Data models: added/removed/retyped request/response fields.
+    - CLI: new commands/flags; removed/renamed flags.
+
+    OUTPUT:
+    - category from the categories input; cwe_id for security when applicable.
+    - Reference file + line numbers only; never copy source; leave code_snippet empty.
+    - Reasoning steps 1-2 sentences; do not repeat patch content.
+    - description <=25 words, imperative, no filler or polite/conversational text.
+    - Empty list if none. No approval text ("LGTM").
     """
 
     scope: ScopeResult = dspy.InputField(
@@ -144,6 +396,22 @@ class CodeAndDocReviewSignature(dspy.Signature):
     categories: list[IssueCategory] = dspy.InputField(
         desc="Allowed issue categories. Use only these values for the 'category' field on each issue."
     )
+    readme: str = dspy.InputField(
+        desc="Scope README content (possibly truncated). Empty if the scope has no README."
+    )
+    scope_tree: str = dspy.InputField(
+        desc="Scope directory tree, two levels deep (possibly truncated). Empty if unavailable."
+    )
+    code_references: dict[str, list[str]] = dspy.InputField(
+        desc="Changed names (functions, types) mapped to non-doc files (scope-relative) "
+        "referencing them, defining files included; lists ending in \"…\" are truncated. "
+        "Empty if none found."
+    )
+    doc_references: dict[str, list[str]] = dspy.InputField(
+        desc="Changed names mapped to doc files (scope-relative) mentioning them; lists "
+        "ending in \"…\" are truncated. Empty if none found or documentation is not in "
+        "categories."
+    )
 
     issues: list[Issue] = dspy.OutputField(
         desc="Verified defects and documentation issues. Category must be one of the provided categories. "
@@ -167,40 +435,258 @@ class CodeAndDocReviewer(dspy.Module):
         super().__init__()
         self._cost_tracker = get_cost_tracker()
         self._settings = get_settings()
+        # Signature settings are fixed for the lifetime of the settings instance
+        self._enabled = self._settings.is_signature_enabled("code_and_doc_review")
+        self._max_iters = self._settings.get_max_iters("code_and_doc_review")
+        self._max_parallel_scopes = self._settings.get_max_parallel_scopes("code_and_doc_review")
+        self._scope_timeout = self._settings.get_scope_timeout("code_and_doc_review")
+        self._max_cost = self._settings.get_max_cost("code_and_doc_review")
+        self._compact_patches = self._settings.get_compact_patches("code_and_doc_review")
+        self._mcp_cache: dict[tuple[str | int | None, ...], asyncio.Task[Any]] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # LLM cost of this module's own agent calls in the current run, checked
+        # against max_cost (the pipeline-wide history includes other modules)
+        self._run_cost = 0.0
+        # Documentation presence by scope root, reset every run
+        self._docs_present: dict[Path, bool] = {}
+        # Preloaded README content by scope root, reset every run
+        self._readmes: dict[Path, str] = {}
+        # Preloaded directory trees by scope root, reset every run
+        self._scope_trees: dict[Path, str] = {}
+        # Review results by scope digest, reset every run: the digest cannot see
+        # changes to unpatched files, so results are not reused across runs
+        self._result_cache: LRUCache[str, list[Issue]] = LRUCache(maxsize=RESULT_CACHE_SIZE)
+        # Live MCP connections by (scope root, server), shared by the scopes of a
+        # run under the same root and released after the last of them
+        self._mcp_pool = MCPToolPool(self._create_mcp_tools)
+        # ReAct agents by scope root, paired with the tools they were built from
+        self._agents: dict[Path, tuple[tuple[list[Any], ...], dspy.ReAct]] = {}
+        # Background event loop reused by the sync forward() wrapper
+        self._loop = BackgroundLoop("code-and-doc-reviewer")
+
+    def _wrap_cached_tool(self, tool: Any, scope_root: Path) -> Any:
+        """Wrap a read-only MCP tool so repeated calls are served from the run cache.
 
-    async def _create_mcp_tools(self, scope_root: Path) -> tuple[list[Any], list[Any]]:
-        """Create DSPy tools from MCP servers, rooted at scope directory.
+        Args:
+            tool: DSPy tool created from an MCP server
+            scope_root: Root directory the tool operates on
+
+        Returns:
+            The same tool, with its function replaced by a caching wrapper
+        """
+        policy = TOOL_CACHE_POLICY.get(tool.name)
+        if policy is None:
+            return tool
+        func = tool.func
+        name = tool.name
+
+        async def cached_func(**kwargs: Any) -> Any:
+            key: tuple[str | int | None, ...] = (
+                str(scope_root), name, repr(sorted(kwargs.items()))
+            )
+            if policy == "mtime":
+                try:
+                    mtime = (scope_root / kwargs.get("path", "")).stat().st_mtime_ns
+                except OSError:
+                    mtime = None
+                key += (mtime,)
+            # Cache the in-flight call, so concurrent identical calls (e.g., scopes
+            # sharing a subroot) share one MCP round-trip
+            task = self._mcp_cache.get(key)
+            if task is not None:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+                task = asyncio.create_task(func(**kwargs))
+                self._mcp_cache[key] = task
+            try:
+                # Shield so a cancelled scope does not cancel the shared call
+                return await asyncio.shield(task)
+            except Exception:
+                # Failed calls are retried on the next request, not cached
+                if self._mcp_cache.get(key) is task:
+                    del self._mcp_cache[key]
+                raise
+
+        tool.func = cached_func
+        return tool
+
+    async def _create_mcp_tools(self, key: tuple[Path, Path]) -> tuple[list[Any], list[Any]]:
+        """Create DSPy tools from one MCP server, rooted at a scope directory.
 
         Args:
-            scope_root: Path to the scope root directory (repo_path / scope.subroot)
+            key: (scope_root, server) where server is an entry of MCP_SERVERS
 
         Returns:
             Tuple of (tools list, contexts list for cleanup)
         """
-        tools: list[Any] = []
+        scope_root, server = key
         contexts: list[Any] = []
-        tools_dir = Path(__file__).parent.parent.parent.parent / "tools"
-        scope_root_str = str(scope_root)
-        caller = "code_and_doc_reviewer"
-        # Filesystem tools: read_file, list_directory, get_tree, file_exists, get_file_info
-        tools.extend(
-            await connect_mcp_server(
-                tools_dir / "filesystem" / "server.py", [scope_root_str], contexts, caller
-            )
+        tools = await connect_mcp_server(
+            server, [str(scope_root)], contexts, "code_and_doc_reviewer"
         )
-        # Ripgrep tools: search_literal, find_function_usages, find_type_usages, etc.
-        tools.extend(
-            await connect_mcp_server(
-                tools_dir / "parsers" / "ripgrep" / "server.py", [scope_root_str], contexts, caller
+        return [self._wrap_cached_tool(t, scope_root) for t in tools], contexts
+
+    async def _get_mcp_tools(self, scope_root: Path) -> tuple[list[Any], ...]:
+        """Get pooled tools for a scope root, connecting missing servers concurrently.
+
+        Each server is pooled under its own key, so its connection is owned by a
+        separate holder task and handshakes overlap.
+
+        Args:
+            scope_root: Path to the scope root directory (repo_path / scope.subroot)
+
+        Returns:
+            One tool list per entry of MCP_SERVERS
+        """
+        return tuple(
+            await asyncio.gather(
+                *(self._mcp_pool.get((scope_root, server)) for server in MCP_SERVERS)
             )
         )
-        # Treesitter tools: find_function_definitions, find_function_calls, etc.
-        tools.extend(
-            await connect_mcp_server(
-                tools_dir / "parsers" / "treesitter" / "server.py", [scope_root_str], contexts, caller
+
+    async def _release_mcp_tools(self, scope_root: Path) -> None:
+        """Shut down a scope root's MCP servers and drop the agent built on them.
+
+        Args:
+            scope_root: Path to the scope root directory (repo_path / scope.subroot)
+        """
+        self._agents.pop(scope_root, None)
+        await asyncio.gather(
+            *(self._mcp_pool.release((scope_root, server)) for server in MCP_SERVERS)
+        )
+
+    async def _has_docs(self, scope_root: Path) -> bool:
+        """Check (once per run) whether a scope root contains documentation.
+
+        Args:
+            scope_root: Path to the scope root directory
+
+        Returns:
+            True if _scope_has_docs finds documentation under scope_root
+        """
+        has_docs = self._docs_present.get(scope_root)
+        if has_docs is None:
+            has_docs = await asyncio.to_thread(_scope_has_docs, scope_root)
+            self._docs_present[scope_root] = has_docs
+        return has_docs
+
+    async def _get_readme(self, scope_root: Path) -> str:
+        """Read the scope README once per run.
+
+        Args:
+            scope_root: Path to the scope root directory
+
+        Returns:
+            README content from _read_readme, or an empty string
+        """
+        readme = self._readmes.get(scope_root)
+        if readme is None:
+            readme = await asyncio.to_thread(_read_readme, scope_root)
+            self._readmes[scope_root] = readme
+        return readme
+
+    async def _get_scope_tree(self, scope_root: Path) -> str:
+        """Render the scope directory tree once per run.
+
+        Args:
+            scope_root: Path to the scope root directory
+
+        Returns:
+            Tree from _read_scope_tree, or an empty string
+        """
+        tree = self._scope_trees.get(scope_root)
+        if tree is None:
+            tree = await asyncio.to_thread(_read_scope_tree, scope_root)
+            self._scope_trees[scope_root] = tree
+        return tree
+
+    async def _review_scope(
+        self, scope: ScopeResult, repo_path: Path, max_iters: int
+    ) -> list[Issue]:
+        """Review a single scope with a scope-restricted ReAct agent.
+
+        Args:
+            scope: Scope with changed files to review
+            repo_path: Path to the cloned repository
+            max_iters: Configured maximum iterations for the signature
+
+        Returns:
+            Issues found in the scope, with repo-root-relative paths
+        """
+        # Scope-restrict MCP tools to the scope's subroot directory
+        scope_root = resolve_scope_root(repo_path, scope.subroot)
+        categories = [IssueCategory.BUG, IssueCategory.SECURITY]
+        if not _has_doc_relevant_change(scope):
+            logger.debug(
+                "  Skipping doc review for scope %s: only test or private changes", scope.subroot
             )
+        elif not await self._has_docs(scope_root):
+            logger.debug("  Skipping doc review for scope %s: no docs present", scope.subroot)
+        else:
+            categories.append(IssueCategory.DOCUMENTATION)
+        digest = _scope_digest(scope, scope_root, categories)
+        cached_issues = self._result_cache.get(digest)
+        if cached_issues is not None:
+            logger.info("  Reusing review of identical scope %s", scope.subroot)
+            return [issue.model_copy() for issue in cached_issues]
+        tool_sets = await self._get_mcp_tools(scope_root)
+        scope_iters = _adaptive_max_iters(max_iters, len(scope.changed_files))
+        # Building ReAct renders the signature and tool instructions, so reuse the
+        # agent for as long as its MCP tools stay alive
+        cached = self._agents.get(scope_root)
+        if cached is not None and all(a is b for a, b in zip(cached[0], tool_sets, strict=True)):
+            agent = cached[1]
+        else:
+            agent = dspy.ReAct(
+                signature=CodeAndDocReviewSignature,
+                tools=[tool for tools in tool_sets for tool in tools],
+                max_iters=max_iters,
+            )
+            self._agents[scope_root] = (tool_sets, agent)
+        # Create scope-relative copy so file paths match the scoped tool root
+        scoped = make_scope_relative(scope, compact_patches=self._compact_patches)
+        logger.info(
+            "  Reviewing scope %s (%d files, max_iters=%d)",
+            scope.subroot,
+            len(scope.changed_files),
+            scope_iters,
         )
-        return tools, contexts
+        names = _changed_entity_names(scope)
+        doc_references: dict[str, list[str]] = {}
+        if IssueCategory.DOCUMENTATION in categories:
+            doc_references = await _find_references(scope_root, names, DOC_REFERENCE_GLOBS)
+        code_references = await _find_references(scope_root, names, CODE_REFERENCE_GLOBS)
+        probe = CostProbe()
+        try:
+            with probe.attach():
+                result = await agent.acall(
+                    scope=scoped,
+                    categories=categories,
+                    readme=await self._get_readme(scope_root),
+                    scope_tree=await self._get_scope_tree(scope_root),
+                    code_references=code_references,
+                    doc_references=doc_references,
+                    max_iters=scope_iters,
+                )
+        finally:
+            # Counted even if the scope times out or fails mid-run
+            self._run_cost += probe.cost
+        issues = [
+            issue for issue in (result.issues or [])
+            if issue.confidence >= MIN_CONFIDENCE
+        ]
+        # Restore repo-root-relative paths in reported issues
+        restore_repo_paths(issues, scope.subroot)
+        logger.debug("  Scope %s: %d issues", scope.subroot, len(issues))
+        self._result_cache[digest] = [issue.model_copy() for issue in issues]
+        return issues
+
+    async def aclose(self) -> None:
+        """Shut down MCP servers still running (e.g., after a cancelled run)."""
+        self._agents.clear()
+        await self._mcp_pool.aclose()
 
     async def aforward(
         self, scopes: Sequence[ScopeResult], repo_path: Path
@@ -209,7 +695,8 @@ class CodeAndDocReviewer(dspy.Module):
 
         For each scope, MCP tools are created rooted at repo_path/scope.subroot
         so the agent can only access files within the scope boundary. This prevents
-        unnecessary out-of-scope tool calls that waste tokens and cost.
+        unnecessary out-of-scope tool calls that waste tokens and cost. Scopes are
+        reviewed concurrently, bounded by the max_parallel_scopes setting.
 
         Args:
             scopes: List of identified scopes with their changed files
@@ -218,62 +705,109 @@ class CodeAndDocReviewer(dspy.Module):
         Returns:
             List of issues (bugs, security, documentation) found across all scopes
         """
-        if not self._settings.is_signature_enabled("code_and_doc_review"):
+        if not self._enabled:
             logger.debug("Skipping code_and_doc_review: disabled")
             return []
 
-        changed_scopes = [s for s in scopes if s.has_changes and s.changed_files]
+        # Select reviewable scopes and count their files in a single pass
+        changed_scopes: list[ScopeResult] = []
+        skipped_count = 0
+        total_files = 0
+        for s in scopes:
+            if not (s.has_changes and s.changed_files):
+                continue
+            if not _is_reviewable(s):
+                skipped_count += 1
+                continue
+            changed_scopes.append(s)
+            total_files += len(s.changed_files)
+        if skipped_count > 0:
+            logger.info("Skipping %d scopes with no reviewable changes", skipped_count)
         if not changed_scopes:
             logger.info("No scopes with changes to review")
             return []
 
         all_issues: list[Issue] = []
-        max_iters = self._settings.get_max_iters("code_and_doc_review")
+        seen: set[tuple[IssueCategory, str, int | None, str]] = set()
+        max_iters = self._max_iters
+        semaphore = asyncio.Semaphore(self._max_parallel_scopes)
+        self._mcp_cache.clear()
+        self._docs_present.clear()
+        self._readmes.clear()
+        self._scope_trees.clear()
+        self._result_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._run_cost = 0.0
 
-        total_files = sum(len(s.changed_files) for s in changed_scopes)
         logger.info(
-            f"Reviewing code and docs for {len(changed_scopes)} scopes "
-            f"({total_files} changed files)..."
+            "Reviewing code and docs for %d scopes (%d changed files)...",
+            len(changed_scopes),
+            total_files,
         )
 
-        for scope in changed_scopes:
-            # Scope-restrict MCP tools to the scope's subroot directory
+        scope_timeout = self._scope_timeout
+        max_cost = self._max_cost
+        # Scopes not yet finished per root; a root's MCP servers are shut down
+        # after its last scope, so at most max_parallel_scopes roots hold servers
+        pending_roots = Counter(resolve_scope_root(repo_path, s.subroot) for s in changed_scopes)
+
+        async def run_scope(scope: ScopeResult) -> list[Issue]:
+            # Failures are contained per scope; only cancellation propagates
+            # to the task group
             scope_root = resolve_scope_root(repo_path, scope.subroot)
-            tools, contexts = await self._create_mcp_tools(scope_root)
-            try:
-                agent = dspy.ReAct(
-                    signature=CodeAndDocReviewSignature,
-                    tools=tools,
-                    max_iters=max_iters,
-                )
-                # Create scope-relative copy so file paths match the scoped tool root
-                scoped = make_scope_relative(scope)
-                logger.info(
-                    f"  Reviewing scope {scope.subroot} "
-                    f"({len(scope.changed_files)} files)"
-                )
-                async with SignatureContext("code_and_doc_review", self._cost_tracker):
-                    result = await agent.acall(
-                        scope=scoped,
-                        categories=[IssueCategory.BUG, IssueCategory.SECURITY, IssueCategory.DOCUMENTATION],
+            async with semaphore:
+                try:
+                    if max_cost is not None and self._run_cost >= max_cost:
+                        logger.warning(
+                            "Skipping scope %s: code_and_doc_review cost budget ($%.2f) exhausted",
+                            scope.subroot,
+                            max_cost,
+                        )
+                        return []
+                    return await asyncio.wait_for(
+                        self._review_scope(scope, repo_path, max_iters), timeout=scope_timeout
                     )
-
-                issues = [
-                    issue for issue in (result.issues or [])
-                    if issue.confidence >= MIN_CONFIDENCE
-                ]
-                # Restore repo-root-relative paths in reported issues
-                restore_repo_paths(issues, scope.subroot)
-                all_issues.extend(issues)
-                logger.debug(
-                    f"  Scope {scope.subroot}: {len(issues)} issues"
+                except TimeoutError:
+                    logger.error(
+                        "Review timed out for scope %s after %ss", scope.subroot, scope_timeout
+                    )
+                except Exception as e:
+                    logger.error("Review failed for scope %s: %s", scope.subroot, e, exc_info=e)
+                finally:
+                    # Released while still holding the slot, so the bound holds
+                    pending_roots[scope_root] -= 1
+                    if not pending_roots[scope_root]:
+                        await self._release_mcp_tools(scope_root)
+                return []
+
+        # One context for all scopes: concurrent per-scope contexts would each
+        # attribute the other scopes' LM history entries to themselves
+        async with (
+            SignatureContext("code_and_doc_review", self._cost_tracker),
+            asyncio.TaskGroup() as group,
+        ):
+            tasks = [group.create_task(run_scope(scope)) for scope in changed_scopes]
+
+        for task in tasks:
+            for issue in task.result():
+                # Overlapping scopes can report the same defect more than once
+                key = (
+                    issue.category,
+                    issue.filename,
+                    issue.line_start,
+                    issue.title.lower().strip(),
                 )
-            except Exception as e:
-                logger.error(f"Review failed for scope {scope.subroot}: {e}")
-            finally:
-                await cleanup_mcp_contexts(contexts)
+                if key not in seen:
+                    seen.add(key)
+                    all_issues.append(issue)
 
-        logger.info(f"Code and doc review found {len(all_issues)} issues")
+        logger.info(
+            "Code and doc review tool cache: %d hits, %d misses",
+            self._cache_hits,
+            self._cache_misses,
+        )
+        logger.info("Code and doc review found %d issues", len(all_issues))
         return all_issues
 
     def forward(
@@ -281,6 +815,9 @@ class CodeAndDocReviewer(dspy.Module):
     ) -> list[Issue]:
         """Analyze scopes for defects and documentation issues (sync wrapper).
 
+        Runs on a background event loop that is kept across calls. Call close()
+        to shut it down. Async callers should await aforward() instead.
+
         Args:
             scopes: List of identified scopes with their changed files
             repo_path: Path to the cloned repository
@@ -288,4 +825,8 @@ class CodeAndDocReviewer(dspy.Module):
         Returns:
             List of issues found across all scopes
         """
-        return asyncio.run(self.aforward(scopes, repo_path))
\ No newline at end of file
+        return self._loop.run(self.aforward(scopes, repo_path))
+
+    def close(self) -> None:
+        """Shut down MCP servers and the background event loop used by forward()."""
+        self._loop.close(self.aclose)
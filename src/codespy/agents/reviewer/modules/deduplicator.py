@@ -1,24 +1,97 @@
 """Issue deduplication module for removing redundant issues across reviewers."""
 
 import logging
+import string
 from typing import Sequence
 
 import dspy  # type: ignore[import-untyped]
 
 from codespy.agents import SignatureContext, get_cost_tracker
-from codespy.agents.reviewer.models import Issue, IssueSeverity
+from codespy.agents.reviewer.models import Issue
 from codespy.config import get_settings
 
 logger = logging.getLogger(__name__)
 
-# Severity priority (higher number = higher priority)
-SEVERITY_PRIORITY = {
-    IssueSeverity.INFO: 1,
-    IssueSeverity.LOW: 2,
-    IssueSeverity.MEDIUM: 3,
-    IssueSeverity.HIGH: 4,
-    IssueSeverity.CRITICAL: 5,
-}
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+
+def _issue_rank(issue: Issue) -> tuple[int, float]:
+    """Rank an issue for duplicate resolution: severity first, then confidence."""
+    return (issue.severity.priority, issue.confidence)
+
+
+def _normalize_title(title: str) -> str:
+    """Normalize an issue title for exact-duplicate detection."""
+    return " ".join(title.lower().translate(_PUNCTUATION_TABLE).split())
+
+
+def _structural_key(issue: Issue) -> tuple[str, int, int, str]:
+    """Key under which issues count as exact duplicates: location and normalized title."""
+    return (
+        issue.filename,
+        issue.line_start or -1,
+        issue.line_end or -1,
+        _normalize_title(issue.title),
+    )
+
+
+def _merge_duplicate(winner: Issue, loser: Issue) -> Issue:
+    """Keep the winner, filling its missing cwe_id and suggestion from the loser."""
+    update: dict[str, str] = {}
+    if not winner.cwe_id and loser.cwe_id:
+        update["cwe_id"] = loser.cwe_id
+    if not winner.suggestion and loser.suggestion:
+        update["suggestion"] = loser.suggestion
+    return winner.model_copy(update=update) if update else winner
+
+
+def _collapse_structural_duplicates(issues: Sequence[Issue]) -> list[Issue]:
+    """Collapse issues sharing the same location and normalized title.
+
+    Within each (filename, line_start, line_end) bucket, issues with the same
+    normalized title are merged into the one with highest severity, then
+    confidence; a CWE ID or suggestion only the other duplicate carries is
+    kept. Order of first appearance is preserved.
+
+    Args:
+        issues: Issues from all review modules
+
+    Returns:
+        Issues with structural duplicates removed
+    """
+    kept: dict[tuple[str, int, int, str], Issue] = {}
+    for issue in issues:
+        key = _structural_key(issue)
+        current = kept.get(key)
+        if current is None:
+            kept[key] = issue
+        elif _issue_rank(issue) > _issue_rank(current):
+            kept[key] = _merge_duplicate(issue, current)
+        else:
+            kept[key] = _merge_duplicate(current, issue)
+    return list(kept.values())
+
+
+def _restore_order(issues: Sequence[Issue], original: Sequence[Issue]) -> list[Issue]:
+    """Sort issues into the order in which they first appeared in original.
+
+    Issues are matched to their original position by structural key, falling
+    back to the first original issue in the same file; anything unmatched
+    goes last. The sort is stable.
+    """
+    key_positions: dict[tuple[str, int, int, str], int] = {}
+    file_positions: dict[str, int] = {}
+    for index, issue in enumerate(original):
+        key_positions.setdefault(_structural_key(issue), index)
+        file_positions.setdefault(issue.filename, index)
+
+    def position(issue: Issue) -> int:
+        found = key_positions.get(_structural_key(issue))
+        if found is None:
+            found = file_positions.get(issue.filename, len(original))
+        return found
+
+    return sorted(issues, key=position)
 
 
 class IssueDeduplicationSignature(dspy.Signature):
@@ -65,6 +138,7 @@ class IssueDeduplicator(dspy.Module):
         super().__init__()
         self._cost_tracker = get_cost_tracker()
         self._settings = get_settings()
+        self._agent = dspy.ChainOfThought(IssueDeduplicationSignature)
 
     def forward(self, issues: Sequence[Issue]) -> list[Issue]:
         """Deduplicate issues and return the unique list.
@@ -88,18 +162,31 @@ class IssueDeduplicator(dspy.Module):
 
         logger.info(f"Deduplicating {len(issues)} issues...")
 
+        # Cheap structural pass first: identical location + title needs no LLM
+        collapsed = _collapse_structural_duplicates(issues)
+        if len(collapsed) < len(issues):
+            logger.info(f"Removed {len(issues) - len(collapsed)} exact duplicate issues")
+
+        # Semantic duplicates must reference the same file, so only issues sharing a
+        # file with another surviving issue are sent to the LLM
+        file_counts: dict[str, int] = {}
+        for issue in collapsed:
+            file_counts[issue.filename] = file_counts.get(issue.filename, 0) + 1
+        candidates = [i for i in collapsed if file_counts[i.filename] > 1]
+        if len(candidates) <= 1:
+            return collapsed
+        unique = [i for i in collapsed if file_counts[i.filename] == 1]
+
         try:
-            deduplicator_agent = dspy.ChainOfThought(IssueDeduplicationSignature)
             # Track deduplication signature costs
             with SignatureContext("deduplication", self._cost_tracker):
-                result = deduplicator_agent(issues=list(issues))
+                result = self._agent(issues=candidates)
             deduplicated = result.deduplicated_issues
-            removed_count = len(issues) - len(deduplicated)
+            removed_count = len(candidates) - len(deduplicated)
             if removed_count > 0:
                 logger.info(f"Removed {removed_count} duplicate issues")
-            return deduplicated
+            return _restore_order(unique + deduplicated, collapsed)
         except Exception as e:
             logger.error(f"Error during deduplication: {e}")
-            # Fall back to returning original issues
-            return list(issues)
-  
\ No newline at end of file
+            # Fall back to the structurally deduplicated issues
+            return collapsed
@@ -2,19 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
 import os
+import re
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from codespy.tools.git.models import ChangedFile
 from codespy.agents.reviewer.models import Issue
+from codespy.config import get_settings
 
 if TYPE_CHECKING:
     from codespy.agents.reviewer.models import ScopeResult
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Worker threads for the default executor of review event loops (to_thread and
+# run_in_executor bridging); bounded so many concurrent scopes cannot flood threads
+MAX_EXECUTOR_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+
+# Root of the codespy.tools package, which holds the MCP server scripts
+TOOLS_DIR = Path(__file__).resolve().parents[3] / "tools"
 
 # Language detection based on file extension
 EXTENSION_TO_LANGUAGE = {
@@ -47,13 +64,137 @@ EXTENSION_TO_LANGUAGE = {
 MIN_CONFIDENCE = 0.5
 
 # Markdown file extensions to review
-MARKDOWN_EXTENSIONS = {".md", ".markdown", ".mdx", ".rst", ".txt"}
+MARKDOWN_EXTENSIONS = frozenset({".md", ".markdown", ".mdx", ".rst", ".txt"})
+
+# Minimum number of meaningful changed lines for a patch to be worth reviewing
+MIN_PATCH_LINES = 1
+
+# Line-comment prefixes by file extension; changed lines starting with one of these
+# do not count as meaningful. Files of other types (e.g., docs) count every line.
+_C_STYLE_COMMENTS = ("//", "/*", "*/")
+_HASH_COMMENTS = ("#",)
+COMMENT_PREFIXES: dict[str, tuple[str, ...]] = {
+    **dict.fromkeys(
+        ("js", "ts", "jsx", "tsx", "go", "rs", "java", "kt", "c", "cpp", "h", "hpp",
+         "cs", "php", "swift", "scala"),
+        _C_STYLE_COMMENTS,
+    ),
+    **dict.fromkeys(("py", "rb", "sh", "bash"), _HASH_COMMENTS),
+    "sql": ("--",),
+}
+
+# Comments that change behavior (build constraints, shebangs, type checker and
+# linter pragmas); changed lines matching this always count as meaningful
+_DIRECTIVE_COMMENT_RE = re.compile(
+    r"^(?:#!|//\s*(?:go:|\+build|nolint)|#\s*(?:type:|noqa|pragma|pylint:|mypy:|fmt:|-\*-))"
+    r"|eslint-|@ts-|prettier-ignore|istanbul ignore|NOSONAR"
+)
 
+# Markup-only characters (headings, emphasis, rules, list bullets, table pipes,
+# rst underlines); doc lines made only of these do not count as meaningful
+_MARKDOWN_PUNCTUATION = "#*->|=~_` \t"
 
+
+@lru_cache(maxsize=4096)
 def is_markdown_file(filename: str) -> bool:
-    """Check if the file is a markdown documentation file."""
-    _, ext = os.path.splitext(filename.lower())
-    return ext in MARKDOWN_EXTENSIONS
+    """Check if the file is a markdown documentation file (memoized per filename)."""
+    # Lowercase only the suffix; a dot inside a directory name never yields a
+    # suffix in MARKDOWN_EXTENSIONS since those contain no "/"
+    dot = filename.rfind(".")
+    return dot != -1 and filename[dot:].lower() in MARKDOWN_EXTENSIONS
+
+
+# Unified diff hunk header: @@ -old_start[,count] +new_start[,count] @@ [section]
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,\d+)? \+(\d+)(?:,\d+)? @@(.*)$")
+
+
+def is_trivial_patch(patch: str, extension: str = "") -> bool:
+    """Check if a patch has no meaningful added/removed lines.
+
+    Lines that are blank, comment-only for the file's extension
+    (see COMMENT_PREFIXES), or markup-only in a markdown file
+    (see _MARKDOWN_PUNCTUATION) are not meaningful. Directive comments
+    (see _DIRECTIVE_COMMENT_RE) are.
+
+    Args:
+        patch: Unified diff patch text
+        extension: File extension without the dot (e.g., "py")
+
+    Returns:
+        True if the patch has fewer than MIN_PATCH_LINES meaningful changed lines
+    """
+    comment_prefixes = COMMENT_PREFIXES.get(extension, ())
+    markdown = f".{extension}" in MARKDOWN_EXTENSIONS
+    changed_lines = 0
+    in_hunk = False
+    for line in patch.splitlines():
+        if line.startswith("@@"):
+            in_hunk = True
+            continue
+        # "+++"/"---" are file headers only before the first hunk; inside a hunk
+        # they are changed lines (e.g., "++i;" added, or a markdown rule)
+        if not in_hunk and line.startswith(("+++", "---")):
+            continue
+        if not line.startswith(("+", "-")):
+            continue
+        content = line[1:].strip()
+        if not content or content == "*":
+            continue
+        if content.startswith(comment_prefixes) and not _DIRECTIVE_COMMENT_RE.search(content):
+            continue
+        if markdown and not content.strip(_MARKDOWN_PUNCTUATION):
+            continue
+        changed_lines += 1
+        if changed_lines >= MIN_PATCH_LINES:
+            return False
+    return True
+
+
+def compact_patch(patch: str) -> str:
+    """Drop unchanged context lines from a unified diff patch.
+
+    Added/removed lines are kept. Wherever context lines were dropped, a hunk
+    header pointing at the next kept line is emitted, so line numbers in the
+    old and new file can still be derived from the compacted patch.
+
+    Args:
+        patch: Unified diff patch text
+
+    Returns:
+        Patch containing only hunk headers and changed lines
+    """
+    lines: list[str] = []
+    old_line = new_line = 0
+    section = ""
+    in_hunk = need_header = False
+    for line in patch.splitlines():
+        match = _HUNK_HEADER_RE.match(line)
+        if match:
+            old_line, new_line = int(match.group(1)), int(match.group(2))
+            section = match.group(3)
+            in_hunk = need_header = True
+        elif not in_hunk:
+            # File headers (diff --git, ---/+++) before the first hunk
+            lines.append(line)
+        elif line.startswith(("+", "-")):
+            if need_header:
+                lines.append(f"@@ -{old_line} +{new_line} @@{section}")
+                need_header = False
+                section = ""
+            lines.append(line)
+            if line.startswith("+"):
+                new_line += 1
+            else:
+                old_line += 1
+        elif line.startswith("\\"):
+            # "\ No newline at end of file" applies to the preceding line
+            if not need_header:
+                lines.append(line)
+        else:
+            old_line += 1
+            new_line += 1
+            need_header = True
+    return "\n".join(lines)
 
 
 def get_language(file: ChangedFile) -> str:
@@ -104,37 +245,37 @@ def resolve_scope_root(repo_path: Path, subroot: str) -> Path:
     return repo_path if subroot == "." else repo_path / subroot
 
 
-def make_scope_relative(scope: ScopeResult) -> ScopeResult:
+def make_scope_relative(scope: ScopeResult, compact_patches: bool = False) -> ScopeResult:
     """Create a copy of a ScopeResult with file paths relative to scope.subroot.
 
     When MCP tools are rooted at repo_path/scope.subroot, the agent needs file
-    paths relative to the scope root (not the repo root). This function creates
-    a shallow copy of the scope with adjusted filenames.
+    paths relative to the scope root (not the repo root). Only the path fields
+    are rewritten: copies are made with model_copy (no re-validation), so patch
+    text is shared with the original scope rather than duplicated, unless
+    compact_patches is set.
 
     Args:
         scope: Original scope with repo-root-relative file paths
+        compact_patches: If True, patches are also replaced by compact_patch()
 
     Returns:
         New ScopeResult with scope-relative file paths in changed_files.
         The subroot is set to "." since paths are now relative to it.
     """
-    from codespy.agents.reviewer.models import PackageManifest, ScopeResult as SR
-
-    if scope.subroot == ".":
+    if scope.subroot == "." and not compact_patches:
         return scope  # Already at repo root, no transformation needed
 
     relative_files = [
-        ChangedFile(
-            filename=strip_prefix(f.filename, scope.subroot),
-            status=f.status,
-            additions=f.additions,
-            deletions=f.deletions,
-            patch=f.patch,
-            previous_filename=(
-                strip_prefix(f.previous_filename, scope.subroot)
-                if f.previous_filename
-                else None
-            ),
+        f.model_copy(
+            update={
+                "filename": strip_prefix(f.filename, scope.subroot),
+                "previous_filename": (
+                    strip_prefix(f.previous_filename, scope.subroot)
+                    if f.previous_filename
+                    else None
+                ),
+                "patch": compact_patch(f.patch) if compact_patches and f.patch else f.patch,
+            }
         )
         for f in scope.changed_files
     ]
@@ -142,27 +283,25 @@ def make_scope_relative(scope: ScopeResult) -> ScopeResult:
     # Adjust manifest paths too
     manifest = None
     if scope.package_manifest:
-        manifest = PackageManifest(
-            manifest_path=strip_prefix(scope.package_manifest.manifest_path, scope.subroot),
-            lock_file_path=(
-                strip_prefix(scope.package_manifest.lock_file_path, scope.subroot)
-                if scope.package_manifest.lock_file_path
-                else None
-            ),
-            package_manager=scope.package_manifest.package_manager,
-            dependencies_changed=scope.package_manifest.dependencies_changed,
+        manifest = scope.package_manifest.model_copy(
+            update={
+                "manifest_path": strip_prefix(
+                    scope.package_manifest.manifest_path, scope.subroot
+                ),
+                "lock_file_path": (
+                    strip_prefix(scope.package_manifest.lock_file_path, scope.subroot)
+                    if scope.package_manifest.lock_file_path
+                    else None
+                ),
+            }
         )
 
-    return SR(
-        subroot=".",
-        scope_type=scope.scope_type,
-        has_changes=scope.has_changes,
-        is_dependency=scope.is_dependency,
-        confidence=scope.confidence,
-        language=scope.language,
-        package_manifest=manifest,
-        changed_files=relative_files,
-        reason=scope.reason,
+    return scope.model_copy(
+        update={
+            "subroot": ".",
+            "package_manifest": manifest,
+            "changed_files": relative_files,
+        }
     )
 
 
@@ -185,5 +324,124 @@ def restore_repo_paths(issues: list[Issue], subroot: str) -> None:
             issue.filename = prefix + issue.filename
 
 
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop for running review modules.
+
+    Uses uvloop when the use_uvloop setting is enabled and uvloop is installed,
+    otherwise the default asyncio loop. uvloop supports the subprocess
+    transports used by the stdio MCP servers. When use_eager_tasks is enabled
+    and the running Python provides asyncio.eager_task_factory (3.12+), tasks
+    run synchronously until their first suspension instead of being scheduled.
+    The loop's default executor is bounded to MAX_EXECUTOR_WORKERS threads.
+
+    Returns:
+        A new, unset event loop
+    """
+    settings = get_settings()
+    loop: asyncio.AbstractEventLoop | None = None
+    if settings.use_uvloop:
+        try:
+            import uvloop  # type: ignore[import-not-found]
+        except ImportError:
+            logger.warning("use_uvloop is enabled but uvloop is not installed; using asyncio")
+        else:
+            loop = uvloop.new_event_loop()
+    if loop is None:
+        loop = asyncio.new_event_loop()
+    loop.set_default_executor(
+        ThreadPoolExecutor(max_workers=MAX_EXECUTOR_WORKERS, thread_name_prefix="codespy")
+    )
+    if settings.use_eager_tasks and hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+def _run_on_new_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on a fresh loop from new_event_loop in the current thread."""
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        return runner.run(coro)
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh loop from new_event_loop.
 
+    Drop-in replacement for asyncio.run() that honors the use_uvloop setting.
+    Unlike asyncio.run(), it also works when called from a thread with a running
+    event loop (notebooks, async hosts): the coroutine then runs in a worker
+    thread, with the caller's contextvars, while the caller blocks.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run_on_new_loop(coro)
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="run-async") as pool:
+        return pool.submit(context.run, _run_on_new_loop, coro).result()
+
+
+class BackgroundLoop:
+    """Event loop running in a daemon thread, kept across sync calls.
+
+    Sync forward() wrappers dispatch to it so that loop-bound resources (pooled
+    MCP connections) survive between calls, and so they also work when the
+    caller is itself inside a running event loop (notebooks, async hosts).
+    run_coroutine_threadsafe copies the caller's contextvars, so dspy.context()
+    overrides still apply.
+    """
 
+    def __init__(self, name: str) -> None:
+        """Initialize without starting the loop.
+
+        Args:
+            name: Thread name, for debugging
+        """
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background loop and wait for its result.
+
+        Args:
+            coro: The coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        with self._lock:
+            if self._loop is None:
+                self._loop = new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name=self._name, daemon=True
+                )
+                self._thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self, cleanup: Callable[[], Coroutine[Any, Any, None]] | None = None) -> None:
+        """Run an optional cleanup coroutine, then stop and close the loop.
+
+        Args:
+            cleanup: Coroutine function awaited on the loop before it stops
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        try:
+            if cleanup is not None:
+                asyncio.run_coroutine_threadsafe(cleanup(), loop).result()
+            asyncio.run_coroutine_threadsafe(loop.shutdown_asyncgens(), loop).result()
+            asyncio.run_coroutine_threadsafe(loop.shutdown_default_executor(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
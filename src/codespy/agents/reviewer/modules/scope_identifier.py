@@ -1,6 +1,5 @@
 """Scope identifier module for detecting code scopes in repositories."""
 
-import asyncio
 import logging
 from pathlib import Path
 from typing import Any
@@ -10,6 +9,7 @@ from pydantic import BaseModel, Field
 
 from codespy.agents import SignatureContext, get_cost_tracker
 from codespy.agents.reviewer.models import PackageManifest, ScopeResult, ScopeType
+from codespy.agents.reviewer.modules.helpers import TOOLS_DIR, run_async
 from codespy.config import get_settings
 from codespy.tools.git.models import ChangedFile, MergeRequest, should_review_file
 from codespy.tools.mcp_utils import cleanup_mcp_contexts, connect_mcp_server
@@ -172,13 +172,12 @@ class ScopeIdentifier(dspy.Module):
         """Create DSPy tools from MCP servers."""
         tools: list[Any] = []
         contexts: list[Any] = []
-        tools_dir = Path(__file__).parent.parent.parent.parent / "tools"
         repo_path_str = str(repo_path)
         caller = "scope_identifier"
-        tools.extend(await connect_mcp_server(tools_dir / "filesystem" / "server.py", [repo_path_str], contexts, caller))
-        tools.extend(await connect_mcp_server(tools_dir / "parsers" / "ripgrep" / "server.py", [repo_path_str], contexts, caller))
-        tools.extend(await connect_mcp_server(tools_dir / "parsers" / "treesitter" / "server.py", [repo_path_str], contexts, caller))
-        tools.extend(await connect_mcp_server(tools_dir / "git" / "server.py", [], contexts, caller))
+        tools.extend(await connect_mcp_server(TOOLS_DIR / "filesystem" / "server.py", [repo_path_str], contexts, caller))
+        tools.extend(await connect_mcp_server(TOOLS_DIR / "parsers" / "ripgrep" / "server.py", [repo_path_str], contexts, caller))
+        tools.extend(await connect_mcp_server(TOOLS_DIR / "parsers" / "treesitter" / "server.py", [repo_path_str], contexts, caller))
+        tools.extend(await connect_mcp_server(TOOLS_DIR / "git" / "server.py", [], contexts, caller))
         return tools, contexts
 
     async def aforward(self, mr: MergeRequest, repo_path: Path) -> list[ScopeResult]:
@@ -287,7 +286,9 @@ class ScopeIdentifier(dspy.Module):
                 if filepath in changed_files_map:
                     changed_files.append(changed_files_map[filepath])
                 else:
-                    logger.warning(f"File '{filepath}' from scope assignment not found in PR changed files")
+                    logger.warning(
+                        "File '%s' from scope assignment not found in PR changed files", filepath
+                    )
             results.append(ScopeResult(
                 subroot=assignment.subroot,
                 scope_type=assignment.scope_type,
@@ -303,4 +304,4 @@ class ScopeIdentifier(dspy.Module):
 
     def forward(self, mr: MergeRequest, repo_path: Path) -> list[ScopeResult]:
         """Identify scopes (sync wrapper)."""
-        return asyncio.run(self.aforward(mr, repo_path))
+        return run_async(self.aforward(mr, repo_path))
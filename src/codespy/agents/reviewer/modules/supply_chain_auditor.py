@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from collections import Counter
 from pathlib import Path
 from typing import Any, Sequence
 
@@ -9,13 +10,32 @@ import dspy  # type: ignore[import-untyped]
 
 from codespy.agents import SignatureContext, get_cost_tracker
 from codespy.agents.reviewer.models import Issue, IssueCategory, ScopeResult
-from codespy.agents.reviewer.modules.helpers import MIN_CONFIDENCE, resolve_scope_root, strip_prefix, restore_repo_paths
+from codespy.agents.reviewer.modules.helpers import (
+    MIN_CONFIDENCE,
+    TOOLS_DIR,
+    BackgroundLoop,
+    resolve_scope_root,
+    restore_repo_paths,
+    strip_prefix,
+)
 from codespy.config import get_settings
-from codespy.tools.mcp_utils import cleanup_mcp_contexts, connect_mcp_server
+from codespy.tools.mcp_utils import MCPToolPool, connect_mcp_server
 
 logger = logging.getLogger(__name__)
 
 
+# Scope-rooted MCP servers: filesystem for reading files and exploring structure,
+# tree-sitter for parsing code structure, and ripgrep for searching code patterns
+SCOPED_MCP_SERVERS = (
+    TOOLS_DIR / "filesystem" / "server.py",
+    TOOLS_DIR / "parsers" / "treesitter" / "server.py",
+    TOOLS_DIR / "parsers" / "ripgrep" / "server.py",
+)
+
+# OSV vulnerability lookup server (no filesystem root, shared across scopes)
+OSV_MCP_SERVER = TOOLS_DIR / "cyber" / "osv" / "server.py"
+
+
 class SupplyChainSecuritySignature(dspy.Signature):
     """Analyze supply chain security: Dockerfiles and dependencies.
 
@@ -132,7 +152,9 @@ class SupplyChainAuditor(dspy.Module):
 
     MCP tools are scope-restricted: for each scope, filesystem/parser tools are
     rooted at repo_path/scope.subroot so the agent cannot access files outside
-    the scope. OSV tools (no filesystem root) are shared across scopes.
+    the scope. OSV tools (no filesystem root) are shared across scopes and kept
+    alive until aclose() is awaited; scoped servers are shut down once the last
+    scope under their root has been audited.
     """
 
     def __init__(self) -> None:
@@ -140,6 +162,14 @@ class SupplyChainAuditor(dspy.Module):
         super().__init__()
         self._cost_tracker = get_cost_tracker()
         self._settings = get_settings()
+        # Live MCP connections: scoped tools by (scope root, server), released
+        # after the last scope under the root; OSV tools under a single key
+        self._scoped_pool = MCPToolPool(self._create_scoped_tools)
+        self._osv_pool = MCPToolPool(lambda _: self._create_osv_tools())
+        # ReAct agents by scope root, paired with the tool lists they were built from
+        self._agents: dict[Path, tuple[tuple[list[Any], ...], list[Any], dspy.ReAct]] = {}
+        # Background event loop reused by the sync forward() wrapper
+        self._loop = BackgroundLoop("supply-chain-auditor")
 
     def _needs_analysis(self, scopes: Sequence[ScopeResult]) -> bool:
         """Check if any scope has supply-chain-relevant changes.
@@ -165,67 +195,146 @@ class SupplyChainAuditor(dspy.Module):
         return False
 
     async def _create_scoped_tools(
-        self, scope_root: Path
+        self, key: tuple[Path, Path]
     ) -> tuple[list[Any], list[Any]]:
-        """Create scope-restricted DSPy tools from filesystem and parser MCP servers.
+        """Create scope-restricted DSPy tools from one filesystem or parser MCP server.
 
         Args:
-            scope_root: Path to the scope root directory (repo_path / scope.subroot)
+            key: (scope_root, server) where server is an entry of SCOPED_MCP_SERVERS
 
         Returns:
             Tuple of (tools, contexts) for cleanup
         """
-        tools: list[Any] = []
+        scope_root, server = key
         contexts: list[Any] = []
-        tools_dir = Path(__file__).parent.parent.parent.parent / "tools"
-        scope_root_str = str(scope_root)
-        caller = "supply_chain_auditor"
-
-        # Add filesystem tools for reading files and exploring structure
-        tools.extend(await connect_mcp_server(
-            tools_dir / "filesystem" / "server.py",
-            [scope_root_str],
-            contexts,
-            caller,
-        ))
-
-        # Add tree-sitter tools for parsing code structure
-        tools.extend(await connect_mcp_server(
-            tools_dir / "parsers" / "treesitter" / "server.py",
-            [scope_root_str],
-            contexts,
-            caller,
-        ))
-
-        # Add ripgrep tools for searching code patterns
-        tools.extend(await connect_mcp_server(
-            tools_dir / "parsers" / "ripgrep" / "server.py",
-            [scope_root_str],
-            contexts,
-            caller,
-        ))
-
+        tools = await connect_mcp_server(
+            server, [str(scope_root)], contexts, "supply_chain_auditor"
+        )
         return tools, contexts
 
+    async def _get_scoped_tools(self, scope_root: Path) -> tuple[list[Any], ...]:
+        """Get pooled scoped tools, connecting missing servers concurrently.
+
+        Args:
+            scope_root: Path to the scope root directory (repo_path / scope.subroot)
+
+        Returns:
+            One tool list per entry of SCOPED_MCP_SERVERS
+        """
+        return tuple(
+            await asyncio.gather(
+                *(self._scoped_pool.get((scope_root, server)) for server in SCOPED_MCP_SERVERS)
+            )
+        )
+
+    async def _release_scoped_tools(self, scope_root: Path) -> None:
+        """Shut down a scope root's scoped MCP servers and drop the agent built on them.
+
+        Args:
+            scope_root: Path to the scope root directory (repo_path / scope.subroot)
+        """
+        self._agents.pop(scope_root, None)
+        await asyncio.gather(
+            *(self._scoped_pool.release((scope_root, server)) for server in SCOPED_MCP_SERVERS)
+        )
+
     async def _create_osv_tools(self) -> tuple[list[Any], list[Any]]:
         """Create OSV tools (no filesystem root, can be shared).
 
         Returns:
             Tuple of (tools, contexts) for cleanup
         """
-        tools: list[Any] = []
         contexts: list[Any] = []
-        tools_dir = Path(__file__).parent.parent.parent.parent / "tools"
-        caller = "supply_chain_auditor"
+        tools = await connect_mcp_server(OSV_MCP_SERVER, [], contexts, "supply_chain_auditor")
+        return tools, contexts
 
-        tools.extend(await connect_mcp_server(
-            tools_dir / "cyber" / "osv" / "server.py",
-            [],
-            contexts,
-            caller,
-        ))
+    async def _audit_scope(
+        self,
+        scope: ScopeResult,
+        repo_path: Path,
+        osv_tools: list[Any],
+        max_iters: int,
+    ) -> list[Issue]:
+        """Audit a single scope with scope-restricted tools plus the shared OSV tools.
 
-        return tools, contexts
+        Args:
+            scope: The scope to audit
+            repo_path: Path to the cloned repository
+            osv_tools: Shared OSV tools (no filesystem root)
+            max_iters: Maximum ReAct iterations for the agent
+
+        Returns:
+            Supply chain issues found in the scope, with repo-root-relative paths
+        """
+        # Check if we should scan unchanged manifests
+        scan_unchanged = self._settings.get_scan_unchanged("supply_chain")
+
+        # Get manifest info (skip if unchanged and scan_unchanged=False)
+        manifest = scope.package_manifest
+        should_scan_manifest = manifest and (scan_unchanged or manifest.dependencies_changed)
+
+        # Convert manifest paths to scope-relative
+        if should_scan_manifest:
+            manifest_path = strip_prefix(manifest.manifest_path, scope.subroot)
+            lock_file_path = (
+                strip_prefix(manifest.lock_file_path, scope.subroot)
+                if manifest.lock_file_path
+                else ""
+            )
+            package_manager = manifest.package_manager
+        else:
+            manifest_path = ""
+            lock_file_path = ""
+            package_manager = ""
+            if manifest:
+                logger.debug("Skipping unchanged manifest: %s", manifest.manifest_path)
+
+        # Scope-restrict filesystem/parser tools to the scope's subroot
+        scope_root = resolve_scope_root(repo_path, scope.subroot)
+        tool_sets = await self._get_scoped_tools(scope_root)
+
+        # Reuse the agent while both pooled tool lists stay alive
+        cached = self._agents.get(scope_root)
+        if (
+            cached is not None
+            and all(a is b for a, b in zip(cached[0], tool_sets, strict=True))
+            and cached[1] is osv_tools
+        ):
+            supply_chain_agent = cached[2]
+        else:
+            # Combine scoped filesystem tools with shared OSV tools
+            supply_chain_agent = dspy.ReAct(
+                signature=SupplyChainSecuritySignature,
+                tools=[tool for tools in tool_sets for tool in tools] + osv_tools,
+                max_iters=max_iters,
+            )
+            self._agents[scope_root] = (tool_sets, osv_tools, supply_chain_agent)
+
+        logger.debug(
+            "Analyzing supply chain in scope %s: manifest=%s",
+            scope.subroot,
+            bool(manifest_path),
+        )
+        result = await supply_chain_agent.acall(
+            manifest_path=manifest_path,
+            lock_file_path=lock_file_path,
+            package_manager=package_manager,
+            category=IssueCategory.SECURITY,
+        )
+        issues = [
+            issue for issue in (result.issues or [])
+            if issue.confidence >= MIN_CONFIDENCE
+        ]
+        # Restore repo-root-relative paths in reported issues
+        restore_repo_paths(issues, scope.subroot)
+        logger.debug("  Supply chain security in scope %s: %d issues", scope.subroot, len(issues))
+        return issues
+
+    async def aclose(self) -> None:
+        """Shut down the OSV server and any scoped servers still running."""
+        self._agents.clear()
+        await self._scoped_pool.aclose()
+        await self._osv_pool.aclose()
 
     async def aforward(self, scopes: Sequence[ScopeResult], repo_path: Path) -> list[Issue]:
         """Analyze scopes for supply chain security vulnerabilities and return issues.
@@ -233,7 +342,8 @@ class SupplyChainAuditor(dspy.Module):
         For each scope, filesystem/parser tools are created rooted at
         repo_path/scope.subroot so the agent can only access files within the
         scope boundary. OSV tools are shared across scopes since they don't
-        access the filesystem.
+        access the filesystem. Scopes are audited concurrently, bounded by
+        max_parallel_scopes.
 
         Args:
             scopes: The scopes containing changed files to analyze
@@ -254,85 +364,52 @@ class SupplyChainAuditor(dspy.Module):
 
         all_issues: list[Issue] = []
         supply_chain_max_iters = self._settings.get_max_iters("supply_chain")
+        audit_scopes = [s for s in scopes if self._scope_needs_analysis(s)]
+        semaphore = asyncio.Semaphore(self._settings.get_max_parallel_scopes("supply_chain"))
 
-        # Create OSV tools once (shared across scopes, no filesystem root)
-        osv_tools, osv_contexts = await self._create_osv_tools()
-
-        try:
-            for scope in scopes:
-                # Skip scopes with no supply-chain-relevant changes
-                if not self._scope_needs_analysis(scope):
-                    continue
-
-                # Check if we should scan unchanged manifests
-                scan_unchanged = self._settings.get_scan_unchanged("supply_chain")
-
-                # Get manifest info (skip if unchanged and scan_unchanged=False)
-                manifest = scope.package_manifest
-                should_scan_manifest = manifest and (scan_unchanged or manifest.dependencies_changed)
-
-                # Convert manifest paths to scope-relative
-                if should_scan_manifest:
-                    manifest_path = strip_prefix(manifest.manifest_path, scope.subroot)
-                    lock_file_path = (
-                        strip_prefix(manifest.lock_file_path, scope.subroot)
-                        if manifest.lock_file_path
-                        else ""
-                    )
-                    package_manager = manifest.package_manager
-                else:
-                    manifest_path = ""
-                    lock_file_path = ""
-                    package_manager = ""
-                    if manifest:
-                        logger.debug(f"Skipping unchanged manifest: {manifest.manifest_path}")
-
-                # Scope-restrict filesystem/parser tools to the scope's subroot
-                scope_root = resolve_scope_root(repo_path, scope.subroot)
-                scoped_tools, scoped_contexts = await self._create_scoped_tools(scope_root)
+        # OSV tools are shared across scopes (no filesystem root)
+        osv_tools = await self._osv_pool.get(None)
 
-                try:
-                    # Combine scoped filesystem tools with shared OSV tools
-                    all_tools = scoped_tools + osv_tools
-                    supply_chain_agent = dspy.ReAct(
-                        signature=SupplyChainSecuritySignature,
-                        tools=all_tools,
-                        max_iters=supply_chain_max_iters,
-                    )
+        # Scopes not yet audited per root; a root's scoped servers are shut down
+        # after its last scope, so at most max_parallel_scopes roots hold servers
+        pending_roots = Counter(resolve_scope_root(repo_path, s.subroot) for s in audit_scopes)
 
-                    logger.debug(
-                        f"Analyzing supply chain in scope {scope.subroot}: "
-                        f"manifest={bool(manifest_path)}"
+        async def run_scope(scope: ScopeResult) -> list[Issue]:
+            # Failures are contained per scope; only cancellation propagates
+            # to the task group
+            scope_root = resolve_scope_root(repo_path, scope.subroot)
+            async with semaphore:
+                try:
+                    return await self._audit_scope(
+                        scope, repo_path, osv_tools, supply_chain_max_iters
                     )
-                    # Track supply_chain signature costs separately
-                    async with SignatureContext("supply_chain", self._cost_tracker):
-                        result = await supply_chain_agent.acall(
-                            manifest_path=manifest_path,
-                            lock_file_path=lock_file_path,
-                            package_manager=package_manager,
-                            category=IssueCategory.SECURITY,
-                        )
-                    issues = [
-                        issue for issue in result.issues
-                        if issue.confidence >= MIN_CONFIDENCE
-                    ]
-                    # Restore repo-root-relative paths in reported issues
-                    restore_repo_paths(issues, scope.subroot)
-                    all_issues.extend(issues)
-                    logger.debug(f"  Supply chain security in scope {scope.subroot}: {len(issues)} issues")
                 except Exception as e:
-                    logger.error(f"Error analyzing supply chain in scope {scope.subroot}: {e}")
+                    logger.error("Error analyzing supply chain in scope %s: %s", scope.subroot, e)
+                    return []
                 finally:
-                    await cleanup_mcp_contexts(scoped_contexts)
-        finally:
-            await cleanup_mcp_contexts(osv_contexts)
+                    pending_roots[scope_root] -= 1
+                    if not pending_roots[scope_root]:
+                        await self._release_scoped_tools(scope_root)
 
-        logger.info(f"Security audit found {len(all_issues)} issues")
+        # Track supply_chain signature costs once for all concurrent scopes
+        async with (
+            SignatureContext("supply_chain", self._cost_tracker),
+            asyncio.TaskGroup() as group,
+        ):
+            tasks = [group.create_task(run_scope(scope)) for scope in audit_scopes]
+
+        for task in tasks:
+            all_issues.extend(task.result())
+
+        logger.info("Security audit found %d issues", len(all_issues))
         return all_issues
 
     def forward(self, scopes: Sequence[ScopeResult], repo_path: Path) -> list[Issue]:
         """Analyze scopes for supply chain security vulnerabilities (sync wrapper).
 
+        Runs on a background event loop that is kept across calls, so the OSV
+        server connection is reused between invocations. Call close() to release it.
+
         Args:
             scopes: The scopes containing changed files to analyze
             repo_path: Path to the cloned repository for reading manifest files
@@ -340,4 +417,8 @@ class SupplyChainAuditor(dspy.Module):
         Returns:
             List of security issues found across all scopes
         """
-        return asyncio.run(self.aforward(scopes, repo_path))
\ No newline at end of file
+        return self._loop.run(self.aforward(scopes, repo_path))
+
+    def close(self) -> None:
+        """Shut down MCP servers and the background event loop used by forward()."""
+        self._loop.close(self.aclose)
\ No newline at end of file
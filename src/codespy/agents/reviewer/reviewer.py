@@ -24,6 +24,7 @@ from codespy.agents.reviewer.modules import (
     ScopeIdentifier,
     SupplyChainAuditor,
 )
+from codespy.agents.reviewer.modules.helpers import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -133,7 +134,12 @@ class ReviewPipeline(dspy.Module):
             self.code_and_doc_reviewer.aforward(scopes=scopes, repo_path=repo_path),
             self.supply_chain_auditor.aforward(scopes=scopes, repo_path=repo_path),
         ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # MCP servers are bound to this event loop; shut them down before it closes
+            await self.code_and_doc_reviewer.aclose()
+            await self.supply_chain_auditor.aclose()
 
         all_issues: list[Issue] = []
         for i, result in enumerate(results):
@@ -192,19 +198,26 @@ class ReviewPipeline(dspy.Module):
         logger.info("Identifying code scopes...")
         scopes = self.scope_identifier(mr, repo_path)
         for scope in scopes:
-            logger.info(f"  Scope: {scope.subroot} ({scope.scope_type.value}) - {len(scope.changed_files)} files")
+            logger.info(
+                "  Scope: %s (%s) - %d files",
+                scope.subroot,
+                scope.scope_type.value,
+                len(scope.changed_files),
+            )
             if scope.package_manifest:
                 manifest = scope.package_manifest
-                logger.info(f"    Manifest: {manifest.manifest_path} ({manifest.package_manager})")
+                logger.info(
+                    "    Manifest: %s (%s)", manifest.manifest_path, manifest.package_manager
+                )
                 if manifest.lock_file_path:
-                    logger.info(f"    Lock file: {manifest.lock_file_path}")
+                    logger.info("    Lock file: %s", manifest.lock_file_path)
                 if manifest.dependencies_changed:
-                    logger.info(f"    Dependencies changed: Yes")
+                    logger.info("    Dependencies changed: Yes")
 
         # Run review modules concurrently via asyncio.gather
         module_names = ["code_and_doc_reviewer", "supply_chain_auditor"]
         logger.info(f"Running review modules concurrently: {', '.join(module_names)}...")
-        all_issues = asyncio.run(
+        all_issues = run_async(
             self._run_review_modules(scopes, repo_path, module_names)
         )
         logger.info(f"Found {len(all_issues)} issues before deduplication")
@@ -108,6 +108,12 @@ class Settings(BaseSettings):
     llm_retries: int = 3  # Number of retries for LLM API calls
     llm_timeout: int = 240  # Timeout in seconds for LLM calls
 
+    # Run review event loops on uvloop when it is installed (falls back to asyncio)
+    use_uvloop: bool = False
+
+    # Start tasks eagerly on review event loops (Python 3.12+, ignored on older versions)
+    use_eager_tasks: bool = False
+
     # Enable provider-side prompt caching (Anthropic, OpenAI, Bedrock, etc.)
     enable_prompt_caching: bool = True
 
@@ -115,6 +121,9 @@ class Settings(BaseSettings):
     output_format: OutputFormat = "markdown"
     cache_dir: Path = Path.home() / ".cache" / "codespy"
 
+    # Persist LLM responses under cache_dir/llm so re-reviews of unchanged inputs are free
+    enable_llm_disk_cache: bool = False
+
     # Output destinations
     output_stdout: bool = True  # Enable stdout output (markdown or json)
     output_git: bool = True  # Enable Git platform review comments (GitHub PR or GitLab MR)
@@ -190,6 +199,40 @@ class Settings(BaseSettings):
         config = self.get_signature_config(signature_name)
         return config.scan_unchanged if config.scan_unchanged is not None else False
 
+    def get_compact_patches(self, signature_name: str) -> bool:
+        """Get compact_patches for a signature (signature-specific, default: False).
+
+        When True, unchanged context lines are dropped from patches sent to the
+        LLM; hunk headers are re-emitted so line numbers stay derivable.
+        """
+        config = self.get_signature_config(signature_name)
+        return config.compact_patches if config.compact_patches is not None else False
+
+    def get_max_parallel_scopes(self, signature_name: str) -> int:
+        """Get max_parallel_scopes for a signature (signature-specific, default: 4).
+
+        Bounds how many scopes are reviewed concurrently. Each concurrent scope
+        runs its own MCP servers and ReAct agent.
+        """
+        config = self.get_signature_config(signature_name)
+        return config.max_parallel_scopes or 4
+
+    def get_scope_timeout(self, signature_name: str) -> int | None:
+        """Get scope_timeout in seconds for a signature (signature-specific, default: None).
+
+        None means a scope's agent run is not time-limited.
+        """
+        config = self.get_signature_config(signature_name)
+        return config.scope_timeout
+
+    def get_max_cost(self, signature_name: str) -> float | None:
+        """Get max_cost in USD for a signature (signature-specific, default: None).
+
+        None means no cost budget is enforced.
+        """
+        config = self.get_signature_config(signature_name)
+        return config.max_cost
+
     def log_signature_configs(self) -> None:
         """Log all signature configurations."""
         logger.info("Signature configurations:")
@@ -19,6 +19,10 @@ class SignatureConfig(BaseModel):
     max_reasoning_tokens: int | None = None  # Limit reasoning verbosity for JSONAdapter reliability
     temperature: float | None = None  # Lower = more deterministic JSON output
     scan_unchanged: bool | None = None  # For supply_chain: scan unmodified artifacts/manifests
+    max_parallel_scopes: int | None = None  # For scope-based reviewers: concurrent scopes
+    scope_timeout: int | None = None  # For scope-based reviewers: seconds per scope
+    max_cost: float | None = None  # USD budget; remaining work is skipped once exceeded
+    compact_patches: bool | None = None  # Drop unchanged context lines from patches sent to the LLM
 
 
 # Known signature names for env var routing
@@ -34,7 +38,19 @@ SIGNATURE_NAMES = {
 SIGNATURE_PREFIXES = {name.upper() + "_": name for name in SIGNATURE_NAMES}
 
 # Known signature settings for validation
-SIGNATURE_SETTINGS = {"enabled", "max_iters", "model", "max_context_size", "max_reasoning_tokens", "temperature", "scan_unchanged"}
+SIGNATURE_SETTINGS = {
+    "enabled",
+    "max_iters",
+    "model",
+    "max_context_size",
+    "max_reasoning_tokens",
+    "temperature",
+    "scan_unchanged",
+    "max_parallel_scopes",
+    "scope_timeout",
+    "max_cost",
+    "compact_patches",
+}
 
 
 def convert_env_value(value: str) -> Any:
@@ -1,16 +1,52 @@
 """Tools for code parsing, Git platform integration, filesystem operations, web browsing, and security scanning."""
 
-from codespy.tools.cyber import OSVClient, ScanResult, ScanSummary, Vulnerability
-from codespy.tools.filesystem import FileSystem
-from codespy.tools.git import (
-    ChangedFile,
-    GitClient,
-    MergeRequest,
-    detect_platform,
-    get_client,
-)
-from codespy.tools.parsers import RipgrepSearch, SearchResult, TreeSitterParser
-from codespy.tools.web import SearchResults, WebBrowser, WebPage
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from codespy.tools.cyber import OSVClient, ScanResult, ScanSummary, Vulnerability
+    from codespy.tools.filesystem import FileSystem
+    from codespy.tools.git import (
+        ChangedFile,
+        GitClient,
+        MergeRequest,
+        detect_platform,
+        get_client,
+    )
+    from codespy.tools.parsers import RipgrepSearch, SearchResult, TreeSitterParser
+    from codespy.tools.web import SearchResults, WebBrowser, WebPage
+
+# Exported names by defining subpackage. Subpackages are imported on first
+# attribute access so that importing one tool (e.g., from an MCP server
+# process) does not load the git clients, tree-sitter grammars, and web stack.
+_EXPORTS = {
+    "OSVClient": "codespy.tools.cyber",
+    "ScanResult": "codespy.tools.cyber",
+    "ScanSummary": "codespy.tools.cyber",
+    "Vulnerability": "codespy.tools.cyber",
+    "FileSystem": "codespy.tools.filesystem",
+    "ChangedFile": "codespy.tools.git",
+    "GitClient": "codespy.tools.git",
+    "MergeRequest": "codespy.tools.git",
+    "detect_platform": "codespy.tools.git",
+    "get_client": "codespy.tools.git",
+    "RipgrepSearch": "codespy.tools.parsers",
+    "SearchResult": "codespy.tools.parsers",
+    "TreeSitterParser": "codespy.tools.parsers",
+    "SearchResults": "codespy.tools.web",
+    "WebBrowser": "codespy.tools.web",
+    "WebPage": "codespy.tools.web",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names lazily from their subpackage."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 # Note: GitReporter is not exported here to avoid circular imports.
 # Import directly: from codespy.tools.git.reporter import GitReporter
@@ -0,0 +1,21 @@
+"""Cache key helpers shared by the MCP tool servers."""
+
+from pathlib import Path
+
+
+def mtime_ns(path: Path) -> int | None:
+    """Modification time of a path in nanoseconds, or None if it cannot be read.
+
+    MCP servers are reused across reviews, so their lru_cache'd results are
+    keyed on this value to refresh once the file changes.
+
+    Args:
+        path: File or directory to stat
+
+    Returns:
+        st_mtime_ns of the path, or None if it is missing or unreadable
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
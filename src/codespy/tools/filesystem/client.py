@@ -182,6 +182,7 @@ class FileSystem:
         path: str,
         max_bytes: int = 100_000,
         max_lines: int | None = None,
+        start_line: int = 1,
     ) -> FileContent:
         """Read contents of a file.
 
@@ -189,6 +190,7 @@ class FileSystem:
             path: Relative path to file
             max_bytes: Maximum bytes to read (default 100KB)
             max_lines: Maximum lines to read (optional)
+            start_line: First line to return, 1-based (default 1)
 
         Returns:
             FileContent with file data
@@ -218,6 +220,16 @@ class FileSystem:
 
         total_lines = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
 
+        # Skip to the requested line
+        if start_line > 1:
+            offset = 0
+            for _ in range(start_line - 1):
+                offset = content.find("\n", offset) + 1
+                if offset == 0:
+                    offset = len(content)
+                    break
+            content = content[offset:]
+
         # Truncate by bytes
         if len(content) > max_bytes:
             content = content[:max_bytes]
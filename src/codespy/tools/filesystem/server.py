@@ -8,6 +8,7 @@ from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
+from codespy.tools.cache_keys import mtime_ns
 from codespy.tools.filesystem.client import FileSystem
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,10 @@ logger = logging.getLogger(__name__)
 # Get caller module from environment (set by mcp_utils.py)
 _caller_module = os.environ.get("MCP_CALLER_MODULE", "unknown")
 
+# Default read_file size cap; keeps a single call on a large or generated file
+# from flooding the agent's context
+READ_FILE_MAX_BYTES = 16_000
+
 mcp = FastMCP("filesystem")
 _fs: FileSystem | None = None
 
@@ -26,33 +31,50 @@ def _get_fs() -> FileSystem:
     return _fs
 
 
+def _mtime_ns(path: str) -> int | None:
+    """Modification time of a root-relative path; an empty path means the root itself."""
+    fs = _get_fs()
+    return mtime_ns(fs.root / path if path else fs.root)
+
+
 @lru_cache(maxsize=256)
-def _read_file_cached(path: str, max_bytes: int, max_lines: int | None) -> tuple:
+def _read_file_cached(
+    path: str, mtime_ns: int | None, max_bytes: int, max_lines: int | None, start_line: int
+) -> tuple:
     """Cached version of read_file."""
-    result = _get_fs().read_file(path, max_bytes, max_lines)
+    result = _get_fs().read_file(path, max_bytes, max_lines, start_line)
     return tuple(sorted(result.model_dump().items()))
 
 
 @mcp.tool()
-def read_file(path: str, max_bytes: int = 100_000, max_lines: int | None = None) -> dict:
+def read_file(
+    path: str,
+    max_bytes: int = READ_FILE_MAX_BYTES,
+    max_lines: int | None = None,
+    start_line: int = 1,
+) -> dict:
     """Read contents of a file.
 
+    Large files are truncated; if truncated is true, call again with a later
+    start_line (e.g., a line from a search hit) to read further.
+
     Args:
         path: Relative path to file
-        max_bytes: Maximum bytes to read (default 100KB)
+        max_bytes: Maximum bytes to read (default 16KB)
         max_lines: Maximum lines to read (optional)
+        start_line: First line to return, 1-based (default 1)
 
     Returns:
         Dict with path, content, size, lines, and truncated flag
     """
     fs = _get_fs()
     resolved = fs.root / path if path else fs.root
-    logger.info(f"[FS] {_caller_module} -> read_file: {resolved}")
-    return dict(_read_file_cached(path, max_bytes, max_lines))
+    logger.info(f"[FS] {_caller_module} -> read_file: {resolved} (from line {start_line})")
+    return dict(_read_file_cached(path, _mtime_ns(path), max_bytes, max_lines, start_line))
 
 
 @lru_cache(maxsize=256)
-def _list_directory_cached(path: str, include_hidden: bool) -> tuple:
+def _list_directory_cached(path: str, mtime_ns: int | None, include_hidden: bool) -> tuple:
     """Cached version of list_directory."""
     result = _get_fs().list_directory(path, include_hidden)
     return tuple(sorted(result.model_dump().items()))
@@ -72,7 +94,7 @@ def list_directory(path: str = "", include_hidden: bool = False) -> dict:
     fs = _get_fs()
     resolved = fs.root / path if path else fs.root
     logger.info(f"[FS] {_caller_module} -> list_directory: {resolved}")
-    return dict(_list_directory_cached(path, include_hidden))
+    return dict(_list_directory_cached(path, _mtime_ns(path), include_hidden))
 
 
 @lru_cache(maxsize=128)
@@ -100,7 +122,7 @@ def get_tree(path: str = "", max_depth: int = 3, include_hidden: bool = False) -
 
 
 @lru_cache(maxsize=512)
-def _file_exists_cached(path: str) -> bool:
+def _file_exists_cached(path: str, mtime_ns: int | None) -> bool:
     """Cached version of file_exists."""
     return _get_fs().exists(path)
 
@@ -118,11 +140,11 @@ def file_exists(path: str = "") -> bool:
     fs = _get_fs()
     resolved = fs.root / path if path else fs.root
     logger.info(f"[FS] {_caller_module} -> file_exists: {resolved}")
-    return _file_exists_cached(path)
+    return _file_exists_cached(path, _mtime_ns(path))
 
 
 @lru_cache(maxsize=256)
-def _get_file_info_cached(path: str) -> tuple:
+def _get_file_info_cached(path: str, mtime_ns: int | None) -> tuple:
     """Cached version of get_file_info."""
     result = _get_fs().get_info(path)
     return tuple(sorted(result.model_dump().items()))
@@ -141,7 +163,7 @@ def get_file_info(path: str = "") -> dict:
     fs = _get_fs()
     resolved = fs.root / path if path else fs.root
     logger.info(f"[FS] {_caller_module} -> get_file_info: {resolved}")
-    return dict(_get_file_info_cached(path))
+    return dict(_get_file_info_cached(path, _mtime_ns(path)))
 
 
 if __name__ == "__main__":
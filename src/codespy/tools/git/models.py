@@ -281,6 +281,11 @@ class CallerInfo(BaseModel):
     function_name: str = Field(description="Name of the function being called")
 
 
+# Total character budget for related file context, and the minimum share per file
+MAX_RELATED_CHARS = 32_000
+MIN_RELATED_FILE_CHARS = 500
+
+
 class ReviewContext(BaseModel):
     """Context information for code review."""
 
@@ -303,28 +308,52 @@ class ReviewContext(BaseModel):
         """Alias for merge_request (backward compatibility)."""
         return self.merge_request
 
-    def get_context_for_file(self, filename: str) -> str:
-        """Get context string for a specific file."""
-        context_parts = []
+    def get_context_for_file(
+        self, filename: str, max_chars: int = MAX_RELATED_CHARS
+    ) -> str:
+        """Get context string for a specific file.
 
-        # Add related files
-        for related_name, content in self.related_files.items():
-            if related_name != filename:
-                context_parts.append(f"=== Related file: {related_name} ===\n{content}")
+        Related files share a total character budget: each file gets an equal
+        share (at least MIN_RELATED_FILE_CHARS), and the joined result is
+        hard-truncated to max_chars.
 
-        return "\n\n".join(context_parts)
+        Args:
+            filename: The file to get context for (excluded from related files)
+            max_chars: Total character budget for the context string
 
-    def get_callers_for_file(self, filename: str) -> str:
+        Returns:
+            Related file contents, truncated to fit the budget
+        """
+        related = [
+            (name, content)
+            for name, content in self.related_files.items()
+            if name != filename
+        ]
+        if not related:
+            return ""
+
+        per_file = max(MIN_RELATED_FILE_CHARS, max_chars // len(related))
+        context = "\n\n".join(
+            f"=== Related file: {related_name} ===\n"
+            + (content[:per_file] + "\n... (truncated)" if len(content) > per_file else content)
+            for related_name, content in related
+        )
+        if len(context) > max_chars:
+            context = context[:max_chars] + "\n... (related files truncated)"
+        return context
+
+    def get_callers_for_file(self, filename: str) -> str | None:
         """Get formatted caller information for a specific file.
 
         Args:
             filename: The file to get callers for
 
         Returns:
-            Formatted string listing all callers of functions in this file
+            Formatted string listing all callers of functions in this file,
+            or None if no callers were found
         """
-        if filename not in self.callers or not self.callers[filename]:
-            return "No callers found for functions in this file."
+        if not self.callers.get(filename):
+            return None
 
         callers = self.callers[filename]
         lines = ["=== Verified Callers of Changed Functions ==="]
@@ -1,8 +1,10 @@
 """Utilities for MCP server connections."""
 
+import asyncio
 import logging
 import os
 import sys
+from collections.abc import Awaitable, Callable, Hashable
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +14,12 @@ from mcp.client.stdio import stdio_client  # type: ignore[import-not-found]
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for pooled connections owned by another event loop to shut down
+POOL_RELEASE_TIMEOUT = 30
+
+# MCPToolPool entry: (tools future, release event, holder task)
+_PoolEntry = tuple[asyncio.Future[list[Any]], asyncio.Event, asyncio.Task[None]]
+
 
 async def connect_mcp_server(
     mcp_path: Path,
@@ -72,4 +80,138 @@ async def cleanup_mcp_contexts(contexts: list[Any]) -> None:
         try:
             await ctx.__aexit__(None, None, None)
         except Exception as e:
-            logger.warning(f"Error cleaning up MCP context: {e}")
\ No newline at end of file
+            logger.warning(f"Error cleaning up MCP context: {e}")
+
+
+class MCPToolPool:
+    """Keeps MCP server connections alive for reuse, keyed by an arbitrary key.
+
+    MCP transports use anyio cancel scopes, which must be exited by the task that
+    entered them, so each connection set lives in a dedicated holder task that
+    waits for release before cleaning up. Callers release a key once no pending
+    work needs it, so servers do not pile up. Connections are bound to the event
+    loop that created them; when the pool is used from another loop, existing
+    connections are released on their owner loop and the pool starts empty.
+    """
+
+    def __init__(
+        self, create_tools: Callable[[Any], Awaitable[tuple[list[Any], list[Any]]]]
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            create_tools: Coroutine function taking a key and returning
+                (tools, contexts), as built with connect_mcp_server
+        """
+        self._create_tools = create_tools
+        # Live connections by key
+        self._entries: dict[Hashable, _PoolEntry] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def _hold(
+        self, key: Hashable, ready: asyncio.Future[list[Any]], release: asyncio.Event
+    ) -> None:
+        """Own the MCP server contexts for a key until released."""
+        contexts: list[Any] = []
+        try:
+            tools, contexts = await self._create_tools(key)
+            ready.set_result(tools)
+            await release.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+        finally:
+            await cleanup_mcp_contexts(contexts)
+
+    @staticmethod
+    async def _release(entries: list[_PoolEntry]) -> None:
+        """Release entries and wait for their holder tasks; must run on their loop."""
+        for _, release, _ in entries:
+            release.set()
+        await asyncio.gather(*(task for _, _, task in entries), return_exceptions=True)
+
+    async def _release_on(
+        self,
+        owner: asyncio.AbstractEventLoop,
+        entries: list[_PoolEntry],
+    ) -> None:
+        """Release entries owned by a loop, from whichever loop is running.
+
+        Args:
+            owner: Event loop that created the entries' holder tasks
+            entries: Pool entries to shut down
+        """
+        if not entries:
+            return
+        if owner is asyncio.get_running_loop():
+            await self._release(entries)
+            return
+        if owner.is_closed() or not owner.is_running():
+            logger.warning(
+                "Cannot shut down %d MCP connections: their event loop is not running",
+                len(entries),
+            )
+            return
+        future = asyncio.run_coroutine_threadsafe(self._release(entries), owner)
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(future), timeout=POOL_RELEASE_TIMEOUT)
+        except TimeoutError:
+            logger.warning(
+                "Timed out shutting down %d MCP connections on another event loop",
+                len(entries),
+            )
+
+    async def get(self, key: Hashable) -> list[Any]:
+        """Get tools for a key, connecting the MCP servers on first use.
+
+        Args:
+            key: Pool key passed to create_tools (e.g., a scope root path)
+
+        Returns:
+            List of DSPy tools; the same list object while the connection lives
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections owned by another loop cannot be used here; shut them
+            # down on their own loop so their holder tasks exit cleanly
+            owner, stale = self._loop, list(self._entries.values())
+            self._entries.clear()
+            self._loop = loop
+            if owner is not None:
+                await self._release_on(owner, stale)
+        entry = self._entries.get(key)
+        if entry is None:
+            ready: asyncio.Future[list[Any]] = loop.create_future()
+            release = asyncio.Event()
+            task = asyncio.create_task(self._hold(key, ready, release))
+            entry = (ready, release, task)
+            self._entries[key] = entry
+        try:
+            # Shield so a cancelled caller does not cancel the shared future
+            return await asyncio.shield(entry[0])
+        except Exception:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+            raise
+
+    async def release(self, key: Hashable) -> None:
+        """Shut down the MCP servers pooled under a key, if any.
+
+        Args:
+            key: Pool key passed to get()
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None and self._loop is not None:
+            await self._release_on(self._loop, [entry])
+
+    async def aclose(self) -> None:
+        """Shut down all pooled MCP servers, on the loop that owns them."""
+        owner, entries = self._loop, list(self._entries.values())
+        self._entries.clear()
+        self._loop = None
+        if owner is not None:
+            await self._release_on(owner, entries)
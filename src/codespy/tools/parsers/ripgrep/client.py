@@ -1,5 +1,6 @@
 """Ripgrep integration for fast code search and verification."""
 
+import json
 import logging
 import re
 import shutil
@@ -9,8 +10,11 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Matched lines longer than this are truncated (minified bundles, generated data)
+MAX_COLUMNS = 300
 
-@dataclass
+
+@dataclass(slots=True)
 class SearchResult:
     """A single search result from ripgrep."""
 
@@ -40,6 +44,11 @@ class RipgrepSearch:
         self.repo_path = Path(repo_path)
         self._rg_available = shutil.which("rg") is not None
         self._grep_available = shutil.which("grep") is not None
+        if not self._rg_available:
+            logger.warning(
+                "ripgrep (rg) not found in PATH; falling back to grep, which is much "
+                "slower on large repositories"
+            )
 
     @property
     def available(self) -> bool:
@@ -206,10 +215,8 @@ class RipgrepSearch:
         """Search using ripgrep."""
         cmd = [
             "rg",
-            "--line-number",  # Include line numbers
-            "--no-heading",   # Don't group by file
-            "--with-filename",  # Always show filename
-            "--color=never",  # No color codes
+            "--json",  # Structured output: exact paths, line numbers and matches
+            "--no-messages",  # Don't report unreadable files on stderr
         ]
 
         if fixed_string:
@@ -220,10 +227,49 @@ class RipgrepSearch:
             for fp in file_patterns:
                 cmd.extend(["--glob", fp])
 
+        cmd.append("--regexp")
         cmd.append(pattern)
         cmd.append(str(self.repo_path))
 
-        return self._run_search(cmd, pattern)
+        stdout = self._run_command(cmd)
+        if stdout is None:
+            return []
+        results = self._parse_rg_json(stdout)
+        logger.debug(f"Search found {len(results)} results for pattern: {pattern}")
+        return results
+
+    def _parse_rg_json(self, output: str) -> list[SearchResult]:
+        """Parse ripgrep --json output into search results.
+
+        Only "match" messages are used; begin/end/context/summary messages are
+        skipped, as are matches in files whose path or line is not valid UTF-8.
+        """
+        results: list[SearchResult] = []
+        repo_prefix = str(self.repo_path)
+        for line in output.splitlines():
+            if not line.startswith('{"type":"match"'):
+                continue
+            try:
+                data = json.loads(line)["data"]
+                file_path = data["path"]["text"]
+                content = data["lines"]["text"]
+            except (ValueError, KeyError):
+                continue
+
+            # Make path relative to repo
+            if file_path.startswith(repo_prefix):
+                file_path = file_path[len(repo_prefix):].lstrip("/\\")
+
+            submatches = data.get("submatches") or []
+            match_text = submatches[0]["match"].get("text", "") if submatches else ""
+
+            results.append(SearchResult(
+                file=file_path,
+                line_number=data.get("line_number") or 0,
+                line_content=content[:MAX_COLUMNS].strip(),
+                match_text=match_text,
+            ))
+        return results
 
     def _search_with_grep(
         self,
@@ -250,10 +296,8 @@ class RipgrepSearch:
 
         return self._run_search(cmd, pattern)
 
-    def _run_search(self, cmd: list[str], pattern: str) -> list[SearchResult]:
-        """Run search command and parse results."""
-        results: list[SearchResult] = []
-
+    def _run_command(self, cmd: list[str]) -> str | None:
+        """Run a search command and return its stdout, or None on failure."""
         try:
             process = subprocess.run(
                 cmd,
@@ -262,14 +306,30 @@ class RipgrepSearch:
                 timeout=30,  # 30 second timeout
                 cwd=str(self.repo_path),
             )
+        except subprocess.TimeoutExpired:
+            logger.error("Search timed out after 30 seconds")
+            return None
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            return None
 
-            # ripgrep returns 1 for no matches (not an error)
-            if process.returncode > 1:
-                logger.warning(f"Search command failed: {process.stderr}")
-                return []
+        # ripgrep and grep return 1 for no matches (not an error)
+        if process.returncode > 1:
+            logger.warning(f"Search command failed: {process.stderr}")
+            return None
+        return process.stdout
+
+    def _run_search(self, cmd: list[str], pattern: str) -> list[SearchResult]:
+        """Run a grep command and parse its file:line:content output."""
+        results: list[SearchResult] = []
 
+        stdout = self._run_command(cmd)
+        if stdout is None:
+            return []
+
+        try:
             # Parse output: file:line:content
-            for line in process.stdout.strip().split("\n"):
+            for line in stdout.strip().split("\n"):
                 if not line:
                     continue
 
@@ -281,7 +341,7 @@ class RipgrepSearch:
                         line_num = int(parts[1])
                     except ValueError:
                         continue
-                    content = parts[2] if len(parts) > 2 else ""
+                    content = parts[2][:MAX_COLUMNS] if len(parts) > 2 else ""
 
                     # Make path relative to repo
                     if file_path.startswith(str(self.repo_path)):
@@ -301,9 +361,6 @@ class RipgrepSearch:
             logger.debug(f"Search found {len(results)} results for pattern: {pattern}")
             return results
 
-        except subprocess.TimeoutExpired:
-            logger.error("Search timed out after 30 seconds")
-            return []
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     """Information about a function/method definition."""
 
@@ -21,7 +21,7 @@ class FunctionInfo:
     docstring: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CallInfo:
     """Information about a function call."""
 
@@ -33,7 +33,7 @@ class CallInfo:
     caller_function: str | None = None  # Function containing this call
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolInfo:
     """Information about a symbol (variable, type, etc.)."""
 
@@ -49,7 +49,7 @@ class SymbolInfo:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TerraformResourceInfo:
     """Information about a Terraform resource block."""
 
@@ -63,7 +63,7 @@ class TerraformResourceInfo:
     depends_on: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TerraformDataSourceInfo:
     """Information about a Terraform data source block."""
 
@@ -76,7 +76,7 @@ class TerraformDataSourceInfo:
     attributes: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TerraformVariableInfo:
     """Information about a Terraform variable declaration."""
 
@@ -91,7 +91,7 @@ class TerraformVariableInfo:
     validation: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TerraformOutputInfo:
     """Information about a Terraform output declaration."""
 
@@ -104,7 +104,7 @@ class TerraformOutputInfo:
     sensitive: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TerraformModuleCallInfo:
     """Information about a Terraform module call."""
 
@@ -117,7 +117,7 @@ class TerraformModuleCallInfo:
     inputs: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TerraformProviderInfo:
     """Information about a Terraform provider configuration."""
 
@@ -129,7 +129,7 @@ class TerraformProviderInfo:
     attributes: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TerraformLocalInfo:
     """Information about a Terraform locals block entry."""
 
@@ -139,7 +139,7 @@ class TerraformLocalInfo:
     value_expression: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TerraformBlockInfo:
     """Generic container for all Terraform block types in a file."""
 
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from pathlib import Path
 from typing import Any
 
+from cachetools import LRUCache
+
 from codespy.tools.parsers.treesitter.base_extractor import BaseExtractor
 from codespy.tools.parsers.treesitter.extractors import (
     GoExtractor,
@@ -26,6 +29,10 @@ from codespy.tools.parsers.treesitter.models import (
 
 logger = logging.getLogger(__name__)
 
+# Parsed trees kept per parser, keyed by language and source digest, so tool
+# calls on the same file content (e.g., definitions then calls) parse it once
+PARSE_CACHE_SIZE = 256
+
 # Try to import tree-sitter and language grammars
 try:
     import tree_sitter_go as ts_go
@@ -38,7 +45,7 @@ try:
     import tree_sitter_rust as ts_rust
     import tree_sitter_swift as ts_swift
     import tree_sitter_typescript as ts_typescript
-    from tree_sitter import Language, Node, Parser
+    from tree_sitter import Language, Node, Parser, Tree
 
     TREE_SITTER_AVAILABLE = True
 except ImportError:
@@ -46,6 +53,7 @@ except ImportError:
     Parser = Any  # type: ignore[misc]
     Language = Any  # type: ignore[misc]
     Node = Any  # type: ignore[misc]
+    Tree = Any  # type: ignore[assignment, misc]
     logger.debug("Tree-sitter not available, will use ripgrep fallback")
 
 
@@ -87,6 +95,7 @@ class TreeSitterParser:
         self._parsers: dict[str, Parser] = {}
         self._languages: dict[str, Language] = {}
         self._extractors: dict[str, BaseExtractor] = {}
+        self._trees: LRUCache[tuple[str, bytes], Tree] = LRUCache(maxsize=PARSE_CACHE_SIZE)
 
         if TREE_SITTER_AVAILABLE:
             self._init_languages()
@@ -155,6 +164,24 @@ class TreeSitterParser:
             return None
         return self.LANGUAGE_MAP[extension][0]
 
+    def _parse(self, parser: Parser, extension: str, source: bytes) -> Tree:
+        """Parse source with a language parser, reusing the tree for identical content.
+
+        Args:
+            parser: Parser for the file's language
+            extension: File extension without the dot (e.g., "py")
+            source: File content
+
+        Returns:
+            Parsed tree-sitter Tree
+        """
+        key = (self.LANGUAGE_MAP[extension][0], hashlib.blake2b(source, digest_size=16).digest())
+        tree = self._trees.get(key)
+        if tree is None:
+            tree = parser.parse(source)
+            self._trees[key] = tree
+        return tree
+
     def parse_file(self, file_path: Path) -> Node | None:
         """Parse a file and return the AST root node.
 
@@ -174,7 +201,7 @@ class TreeSitterParser:
 
         try:
             content = file_path.read_bytes()
-            tree = parser.parse(content)
+            tree = self._parse(parser, extension, content)
             return tree.root_node
         except Exception as e:
             logger.debug(f"Failed to parse {file_path}: {e}")
@@ -210,7 +237,7 @@ class TreeSitterParser:
 
         try:
             source = content.encode() if content else file_path.read_bytes()
-            tree = parser.parse(source)
+            tree = self._parse(parser, extension, source)
             return extractor.extract_functions(tree.root_node, file_path, source)
         except Exception as e:
             logger.debug(f"Failed to find functions in {file_path}: {e}")
@@ -244,7 +271,7 @@ class TreeSitterParser:
 
         try:
             source = content.encode() if content else file_path.read_bytes()
-            tree = parser.parse(source)
+            tree = self._parse(parser, extension, source)
             calls: list[CallInfo] = []
 
             self._find_calls_recursive(
@@ -286,7 +313,7 @@ class TreeSitterParser:
 
         try:
             source = content.encode() if content else file_path.read_bytes()
-            tree = parser.parse(source)
+            tree = self._parse(parser, extension, source)
             calls: list[CallInfo] = []
 
             self._find_all_calls_recursive(
@@ -460,7 +487,7 @@ class TreeSitterParser:
 
         try:
             source = content.encode() if content else file_path.read_bytes()
-            tree = parser.parse(source)
+            tree = self._parse(parser, extension, source)
             return extractor.extract_terraform_blocks(tree.root_node, file_path, source)
         except Exception as e:
             logger.debug(f"Failed to parse Terraform file {file_path}: {e}")
@@ -10,6 +10,7 @@ from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+from codespy.tools.cache_keys import mtime_ns
 from codespy.tools.parsers.treesitter.parser import TreeSitterParser
 
 logger = logging.getLogger(__name__)
@@ -26,13 +27,22 @@ def _get_parser() -> TreeSitterParser:
     return _parser
 
 
+def _mtime_ns(file_path: str, content: str | None) -> int | None:
+    """Modification time of a repo file; None when inline content is parsed instead."""
+    if content is not None:
+        return None
+    return mtime_ns(_get_parser().repo_path / file_path)
+
+
 # =============================================================================
 # Cached internal functions
 # =============================================================================
 
 
 @lru_cache(maxsize=256)
-def _find_function_definitions_cached(file_path: str, content: str | None = None) -> tuple:
+def _find_function_definitions_cached(
+    file_path: str, mtime_ns: int | None, content: str | None = None
+) -> tuple:
     """Cached version of find_function_definitions."""
     parser = _get_parser()
     path = parser.repo_path / file_path
@@ -41,7 +51,9 @@ def _find_function_definitions_cached(file_path: str, content: str | None = None
 
 
 @lru_cache(maxsize=512)
-def _find_function_calls_cached(file_path: str, function_name: str, content: str | None = None) -> tuple:
+def _find_function_calls_cached(
+    file_path: str, mtime_ns: int | None, function_name: str, content: str | None = None
+) -> tuple:
     """Cached version of find_function_calls."""
     parser = _get_parser()
     path = parser.repo_path / file_path
@@ -50,7 +62,9 @@ def _find_function_calls_cached(file_path: str, function_name: str, content: str
 
 
 @lru_cache(maxsize=256)
-def _find_all_calls_in_file_cached(file_path: str, content: str | None = None) -> tuple:
+def _find_all_calls_in_file_cached(
+    file_path: str, mtime_ns: int | None, content: str | None = None
+) -> tuple:
     """Cached version of find_all_calls_in_file."""
     parser = _get_parser()
     path = parser.repo_path / file_path
@@ -59,7 +73,9 @@ def _find_all_calls_in_file_cached(file_path: str, content: str | None = None) -
 
 
 @lru_cache(maxsize=128)
-def _parse_terraform_file_cached(file_path: str, content: str | None = None) -> tuple | None:
+def _parse_terraform_file_cached(
+    file_path: str, mtime_ns: int | None, content: str | None = None
+) -> tuple | None:
     """Cached version of parse_terraform_file."""
     parser = _get_parser()
     path = parser.repo_path / file_path
@@ -87,7 +103,7 @@ def find_function_definitions(file_path: str, content: str | None = None) -> lis
         signature, parameters, return_type, docstring
     """
     logger.info(f"[TS] {_caller_module} -> find_function_definitions: {file_path}")
-    cached = _find_function_definitions_cached(file_path, content)
+    cached = _find_function_definitions_cached(file_path, _mtime_ns(file_path, content), content)
     return [dict(f) for f in cached]
 
 
@@ -109,7 +125,9 @@ def find_function_calls(
         line_content, arguments_count, caller_function
     """
     logger.info(f"[TS] {_caller_module} -> find_function_calls: {function_name} in {file_path}")
-    cached = _find_function_calls_cached(file_path, function_name, content)
+    cached = _find_function_calls_cached(
+        file_path, _mtime_ns(file_path, content), function_name, content
+    )
     return [dict(c) for c in cached]
 
 
@@ -126,7 +144,7 @@ def find_all_calls_in_file(file_path: str, content: str | None = None) -> list[d
         line_content, arguments_count, caller_function
     """
     logger.info(f"[TS] {_caller_module} -> find_all_calls_in_file: {file_path}")
-    cached = _find_all_calls_in_file_cached(file_path, content)
+    cached = _find_all_calls_in_file_cached(file_path, _mtime_ns(file_path, content), content)
     return [dict(c) for c in cached]
 
 
@@ -154,7 +172,7 @@ def parse_terraform_file(file_path: str, content: str | None = None) -> dict[str
         - locals: List of local value definitions
     """
     logger.info(f"[TS] {_caller_module} -> parse_terraform_file: {file_path}")
-    cached = _parse_terraform_file_cached(file_path, content)
+    cached = _parse_terraform_file_cached(file_path, _mtime_ns(file_path, content), content)
     if cached is None:
         return None
     return dict(cached)
@@ -173,7 +191,7 @@ def list_terraform_resources(file_path: str, content: str | None = None) -> list
         file, line_start, line_end, attributes, depends_on
     """
     logger.info(f"[TS] {_caller_module} -> list_terraform_resources: {file_path}")
-    cached = _parse_terraform_file_cached(file_path, content)
+    cached = _parse_terraform_file_cached(file_path, _mtime_ns(file_path, content), content)
     if cached is None:
         return []
     result_dict = dict(cached)
@@ -193,7 +211,7 @@ def list_terraform_variables(file_path: str, content: str | None = None) -> list
         sensitive, file, line_start, line_end
     """
     logger.info(f"[TS] {_caller_module} -> list_terraform_variables: {file_path}")
-    cached = _parse_terraform_file_cached(file_path, content)
+    cached = _parse_terraform_file_cached(file_path, _mtime_ns(file_path, content), content)
     if cached is None:
         return []
     result_dict = dict(cached)
@@ -213,7 +231,7 @@ def list_terraform_outputs(file_path: str, content: str | None = None) -> list[d
         sensitive, file, line_start, line_end
     """
     logger.info(f"[TS] {_caller_module} -> list_terraform_outputs: {file_path}")
-    cached = _parse_terraform_file_cached(file_path, content)
+    cached = _parse_terraform_file_cached(file_path, _mtime_ns(file_path, content), content)
     if cached is None:
         return []
     result_dict = dict(cached)
@@ -233,7 +251,7 @@ def list_terraform_modules(file_path: str, content: str | None = None) -> list[d
         file, line_start, line_end
     """
     logger.info(f"[TS] {_caller_module} -> list_terraform_modules: {file_path}")
-    cached = _parse_terraform_file_cached(file_path, content)
+    cached = _parse_terraform_file_cached(file_path, _mtime_ns(file_path, content), content)
     if cached is None:
         return []
     result_dict = dict(cached)
@@ -253,7 +271,7 @@ def list_terraform_data_sources(file_path: str, content: str | None = None) -> l
         file, line_start, line_end, attributes
     """
     logger.info(f"[TS] {_caller_module} -> list_terraform_data_sources: {file_path}")
-    cached = _parse_terraform_file_cached(file_path, content)
+    cached = _parse_terraform_file_cached(file_path, _mtime_ns(file_path, content), content)
     if cached is None:
         return []
     result_dict = dict(cached)
@@ -273,7 +291,7 @@ def list_terraform_providers(file_path: str, content: str | None = None) -> list
         file, line_start, line_end
     """
     logger.info(f"[TS] {_caller_module} -> list_terraform_providers: {file_path}")
-    cached = _parse_terraform_file_cached(file_path, content)
+    cached = _parse_terraform_file_cached(file_path, _mtime_ns(file_path, content), content)
     if cached is None:
         return []
     result_dict = dict(cached)
@@ -299,7 +317,7 @@ def get_terraform_summary(file_path: str, content: str | None = None) -> dict[st
         - local_count, local_names
     """
     logger.info(f"[TS] {_caller_module} -> get_terraform_summary: {file_path}")
-    cached = _parse_terraform_file_cached(file_path, content)
+    cached = _parse_terraform_file_cached(file_path, _mtime_ns(file_path, content), content)
 
     if cached is None:
         return {
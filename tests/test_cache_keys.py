@@ -0,0 +1,18 @@
+"""Tests for MCP server cache key helpers."""
+
+import os
+from pathlib import Path
+
+from codespy.tools.cache_keys import mtime_ns
+
+
+def test_changes_when_file_is_modified(tmp_path: Path) -> None:
+    path = tmp_path / "a.py"
+    path.write_text("x = 1\n")
+    before = mtime_ns(path)
+    os.utime(path, ns=(0, (before or 0) + 1_000_000))
+    assert mtime_ns(path) != before
+
+
+def test_missing_path(tmp_path: Path) -> None:
+    assert mtime_ns(tmp_path / "missing.py") is None
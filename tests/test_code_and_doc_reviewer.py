@@ -0,0 +1,209 @@
+"""Tests for code and doc reviewer helpers."""
+
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from codespy.agents.reviewer.models import IssueCategory, ScopeResult, ScopeType
+from codespy.agents.reviewer.modules import code_and_doc_reviewer
+from codespy.agents.reviewer.modules.code_and_doc_reviewer import (
+    CODE_REFERENCE_GLOBS,
+    MCP_SERVERS,
+    REFERENCE_TRUNCATED,
+    CodeAndDocReviewer,
+    _adaptive_max_iters,
+    _cap_references,
+    _changed_entity_names,
+    _find_references,
+    _has_doc_relevant_change,
+    _scope_digest,
+)
+from codespy.agents.reviewer.modules.helpers import resolve_scope_root
+from codespy.tools import mcp_utils
+from codespy.tools.git.models import ChangedFile, FileStatus
+
+ROOT = Path("/repo/packages/auth")
+BOTH = [IssueCategory.BUG, IssueCategory.SECURITY]
+
+
+def make_scope(*files: tuple[str, str], subroot: str = "packages/auth") -> ScopeResult:
+    return ScopeResult(
+        subroot=subroot,
+        scope_type=ScopeType.LIBRARY,
+        has_changes=True,
+        reason="test",
+        changed_files=[
+            ChangedFile(filename=name, status=FileStatus.MODIFIED, patch=patch)
+            for name, patch in files
+        ],
+    )
+
+
+class TestHasDocRelevantChange:
+    def test_parameter_default_in_multiline_signature(self) -> None:
+        patch = "@@ -1,3 +1,3 @@\n def fetch(\n-    timeout: int = 30,\n+    timeout: int = 60,\n"
+        assert _has_doc_relevant_change(make_scope(("client.py", patch)))
+
+    def test_http_status_code(self) -> None:
+        patch = (
+            "@@ -5 +5 @@\n"
+            "-\tw.WriteHeader(http.StatusOK)\n"
+            "+\tw.WriteHeader(http.StatusCreated)\n"
+        )
+        assert _has_doc_relevant_change(make_scope(("handlers.go", patch)))
+
+    def test_go_struct_field_with_json_tag(self) -> None:
+        patch = '@@ -3,2 +3,3 @@\n \tName string `json:"name"`\n+\tEmail string `json:"email"`\n'
+        assert _has_doc_relevant_change(make_scope(("user.go", patch)))
+
+    def test_module_constant(self) -> None:
+        patch = "@@ -1 +1 @@\n-DEFAULT_TIMEOUT = 30\n+DEFAULT_TIMEOUT = 60\n"
+        assert _has_doc_relevant_change(make_scope(("settings.py", patch)))
+
+    def test_settings_field(self) -> None:
+        patch = "@@ -10,2 +10,3 @@\n     model: str\n+    use_uvloop: bool = False\n"
+        assert _has_doc_relevant_change(make_scope(("config.py", patch)))
+
+    def test_tests_only(self) -> None:
+        scope = make_scope(
+            ("tests/test_client.py", "+def test_fetch():\n"),
+            ("pkg/client_test.go", "+func TestFetch(t *testing.T) {\n"),
+            ("web/client.spec.ts", "+it('fetches', () => {});\n"),
+        )
+        assert not _has_doc_relevant_change(scope)
+
+    def test_private_modules_only(self) -> None:
+        scope = make_scope(
+            ("pkg/_helpers.py", "+def parse(raw):\n"),
+            ("pkg/_internal/cache.go", "+func Get() {}\n"),
+        )
+        assert not _has_doc_relevant_change(scope)
+
+    def test_dunder_files_are_public(self) -> None:
+        assert _has_doc_relevant_change(make_scope(("pkg/__init__.py", "+from .a import b\n")))
+
+    def test_mixed_with_public_change(self) -> None:
+        scope = make_scope(("tests/test_client.py", "+x = 1\n"), ("client.py", "+x = 1\n"))
+        assert _has_doc_relevant_change(scope)
+
+
+class TestScopeDigest:
+    def test_ignores_file_and_category_order(self) -> None:
+        a = make_scope(("a.py", "+x"), ("b.py", "+y"))
+        b = make_scope(("b.py", "+y"), ("a.py", "+x"))
+        assert _scope_digest(a, ROOT, BOTH) == _scope_digest(b, ROOT, BOTH[::-1])
+
+    def test_differs_by_patch(self) -> None:
+        a = make_scope(("a.py", "+x"))
+        b = make_scope(("a.py", "+z"))
+        assert _scope_digest(a, ROOT, BOTH) != _scope_digest(b, ROOT, BOTH)
+
+    def test_differs_by_scope_root(self) -> None:
+        scope = make_scope(("a.py", "+x"))
+        other = Path("/other-checkout/packages/auth")
+        assert _scope_digest(scope, ROOT, BOTH) != _scope_digest(scope, other, BOTH)
+
+    def test_differs_by_categories(self) -> None:
+        scope = make_scope(("a.py", "+x"))
+        assert _scope_digest(scope, ROOT, BOTH) != _scope_digest(scope, ROOT, [IssueCategory.BUG])
+
+
+class TestAdaptiveMaxIters:
+    def test_scales_with_file_count(self) -> None:
+        assert _adaptive_max_iters(30, 1) < _adaptive_max_iters(30, 5)
+
+    def test_capped_by_configured_max(self) -> None:
+        assert _adaptive_max_iters(30, 100) == 30
+        assert _adaptive_max_iters(3, 1) == 3
+
+
+class TestChangedEntityNames:
+    def test_skips_private_and_short_names(self) -> None:
+        scope = make_scope(
+            ("a.py", "+def handle_login(user):\n+def _helper():\n-class Foo:\n"),
+            ("b.go", "+func (s *Server) ServeHTTP(w, r) {\n+func run() {\n"),
+        )
+        assert _changed_entity_names(scope) == ["handle_login", "ServeHTTP"]
+
+    def test_deduplicates_in_order(self) -> None:
+        scope = make_scope(("a.py", "-def parse_token(raw):\n+def parse_token(raw, strict):\n"))
+        assert _changed_entity_names(scope) == ["parse_token"]
+
+
+class TestCapReferences:
+    def test_keeps_name_order_and_sorts_paths(self) -> None:
+        refs = {"beta": {"z.py", "y.py"}, "alpha": {"x.py"}}
+        assert _cap_references(refs, ["alpha", "beta", "gamma"]) == {
+            "alpha": ["x.py"],
+            "beta": ["y.py", "z.py"],
+        }
+
+    def test_marks_files_cut_per_name(self, monkeypatch) -> None:
+        monkeypatch.setattr(code_and_doc_reviewer, "MAX_REFERENCE_FILES", 2)
+        refs = {"alpha": {"c.py", "b.py", "a.py"}}
+        assert _cap_references(refs, ["alpha"]) == {
+            "alpha": ["a.py", "b.py", REFERENCE_TRUNCATED]
+        }
+
+    def test_marks_names_past_character_budget(self, monkeypatch) -> None:
+        monkeypatch.setattr(code_and_doc_reviewer, "MAX_REFERENCE_CHARS", 10)
+        refs = {"alpha": {"aaaa.py"}, "beta": {"bb.py", "cc.py"}, "gamma": {"d.py"}}
+        assert _cap_references(refs, ["alpha", "beta", "gamma"]) == {
+            "alpha": ["aaaa.py"],
+            "beta": [REFERENCE_TRUNCATED],
+            "gamma": [REFERENCE_TRUNCATED],
+        }
+
+
+@pytest.mark.skipif(shutil.which("rg") is None, reason="ripgrep not installed")
+class TestFindReferences:
+    @pytest.mark.asyncio
+    async def test_name_after_many_matches_of_another(self, tmp_path: Path) -> None:
+        lines = ["handle_login()"] * 100 + ["parse_token()"]
+        (tmp_path / "app.py").write_text("\n".join(lines))
+        (tmp_path / "README.md").write_text("parse_token")
+        references = await _find_references(
+            tmp_path, ["handle_login", "parse_token"], CODE_REFERENCE_GLOBS
+        )
+        assert references == {"handle_login": ["app.py"], "parse_token": ["app.py"]}
+
+
+class TestMCPServerRelease:
+    @pytest.mark.asyncio
+    async def test_root_released_after_its_last_scope(self, monkeypatch, tmp_path: Path) -> None:
+        live: set[tuple[str, Path]] = set()
+        connects: list[tuple[str, Path]] = []
+        snapshots: list[set[Path]] = []
+
+        async def connect(server: Path, roots: list[str], contexts: list[Any], _: str) -> list[Any]:
+            key = (roots[0], server)
+            live.add(key)
+            connects.append(key)
+            contexts.append(key)
+            return []
+
+        async def cleanup(contexts: list[Any]) -> None:
+            live.difference_update(contexts)
+
+        monkeypatch.setattr(code_and_doc_reviewer, "connect_mcp_server", connect)
+        monkeypatch.setattr(mcp_utils, "cleanup_mcp_contexts", cleanup)
+        reviewer = CodeAndDocReviewer()
+        reviewer._max_parallel_scopes = 1
+
+        async def review(scope: ScopeResult, repo_path: Path, max_iters: int) -> list[Any]:
+            await reviewer._get_mcp_tools(resolve_scope_root(repo_path, scope.subroot))
+            snapshots.append({Path(root) for root, _ in live})
+            return []
+
+        monkeypatch.setattr(reviewer, "_review_scope", review)
+        scopes = [
+            make_scope(("a.py", "+x = 1\n"), subroot="a"),
+            make_scope(("b.py", "+x = 1\n"), subroot="a"),
+            make_scope(("c.py", "+x = 1\n"), subroot="b"),
+        ]
+        assert await reviewer.aforward(scopes, tmp_path) == []
+        assert snapshots == [{tmp_path / "a"}, {tmp_path / "a"}, {tmp_path / "b"}]
+        assert len(connects) == 2 * len(MCP_SERVERS)
+        assert live == set()
@@ -0,0 +1,87 @@
+"""Tests for structural duplicate collapsing in the issue deduplicator."""
+
+from typing import Any
+
+from codespy.agents.reviewer.models import Issue, IssueCategory, IssueSeverity
+from codespy.agents.reviewer.modules.deduplicator import (
+    _collapse_structural_duplicates,
+    _restore_order,
+)
+
+
+def make_issue(**overrides: Any) -> Issue:
+    fields: dict[str, Any] = {
+        "category": IssueCategory.SECURITY,
+        "severity": IssueSeverity.MEDIUM,
+        "title": "SQL injection",
+        "description": "Use parameterized queries.",
+        "filename": "app/db.py",
+        "line_start": 10,
+        "line_end": 12,
+    }
+    fields.update(overrides)
+    return Issue(**fields)
+
+
+class TestCollapseStructuralDuplicates:
+    def test_distinct_issues_kept_in_order(self) -> None:
+        issues = [
+            make_issue(filename="b.py"),
+            make_issue(filename="a.py"),
+            make_issue(filename="b.py", line_start=20, line_end=20),
+            make_issue(filename="b.py", title="Missing auth check"),
+        ]
+        assert _collapse_structural_duplicates(issues) == issues
+
+    def test_title_normalization(self) -> None:
+        issues = [make_issue(title="SQL injection"), make_issue(title="  SQL  Injection!")]
+        assert len(_collapse_structural_duplicates(issues)) == 1
+
+    def test_keeps_highest_severity_then_confidence(self) -> None:
+        low = make_issue(severity=IssueSeverity.LOW, confidence=0.9)
+        high = make_issue(severity=IssueSeverity.HIGH, confidence=0.6)
+        confident = make_issue(severity=IssueSeverity.HIGH, confidence=0.7)
+        [kept] = _collapse_structural_duplicates([low, high, confident])
+        assert kept.severity == IssueSeverity.HIGH
+        assert kept.confidence == 0.7
+
+    def test_fills_cwe_and_suggestion_from_duplicate(self) -> None:
+        winner = make_issue(severity=IssueSeverity.HIGH)
+        loser = make_issue(
+            severity=IssueSeverity.LOW, cwe_id="CWE-89", suggestion="Bind parameters."
+        )
+        [kept] = _collapse_structural_duplicates([loser, winner])
+        assert kept.severity == IssueSeverity.HIGH
+        assert kept.cwe_id == "CWE-89"
+        assert kept.suggestion == "Bind parameters."
+
+    def test_winner_fields_take_precedence(self) -> None:
+        winner = make_issue(severity=IssueSeverity.HIGH, cwe_id="CWE-564")
+        loser = make_issue(severity=IssueSeverity.LOW, cwe_id="CWE-89")
+        [kept] = _collapse_structural_duplicates([winner, loser])
+        assert kept.cwe_id == "CWE-564"
+
+    def test_position_of_first_appearance(self) -> None:
+        first = make_issue(filename="a.py")
+        other = make_issue(filename="b.py")
+        better = make_issue(filename="a.py", severity=IssueSeverity.CRITICAL)
+        kept = _collapse_structural_duplicates([first, other, better])
+        assert [i.filename for i in kept] == ["a.py", "b.py"]
+        assert kept[0].severity == IssueSeverity.CRITICAL
+
+
+class TestRestoreOrder:
+    def test_sorts_by_original_position(self) -> None:
+        original = [make_issue(filename=name) for name in ("c.py", "a.py", "b.py")]
+        shuffled = [original[2], original[0], original[1]]
+        assert _restore_order(shuffled, original) == original
+
+    def test_merged_issue_falls_back_to_file_position(self) -> None:
+        original = [make_issue(filename="b.py"), make_issue(filename="a.py")]
+        merged = make_issue(filename="a.py", title="Combined finding")
+        assert _restore_order([merged, original[0]], original) == [original[0], merged]
+
+    def test_unmatched_issues_go_last(self) -> None:
+        original = [make_issue(filename="a.py")]
+        stray = make_issue(filename="z.py")
+        assert _restore_order([stray, original[0]], original) == [original[0], stray]
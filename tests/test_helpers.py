@@ -0,0 +1,133 @@
+"""Tests for reviewer module helpers."""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from codespy.agents.reviewer.modules.helpers import compact_patch, is_trivial_patch, run_async
+
+HEADER = "diff --git a/f b/f\n--- a/f\n+++ b/f\n"
+
+
+class TestIsTrivialPatch:
+    def test_empty_patch(self) -> None:
+        assert is_trivial_patch("")
+
+    def test_file_headers_only(self) -> None:
+        assert is_trivial_patch(HEADER)
+
+    def test_code_change(self) -> None:
+        assert not is_trivial_patch(HEADER + "@@ -1 +1 @@\n-x = 1\n+x = 2\n", "py")
+
+    def test_blank_and_comment_lines(self) -> None:
+        patch = HEADER + "@@ -1,2 +1,3 @@\n ctx\n+\n+# note\n-# old note\n"
+        assert is_trivial_patch(patch, "py")
+
+    def test_block_comment_lines(self) -> None:
+        patch = HEADER + "@@ -1 +1,3 @@\n+/*\n+ *\n+ */\n+// note\n"
+        assert is_trivial_patch(patch, "c")
+
+    def test_comment_prefix_depends_on_extension(self) -> None:
+        patch = HEADER + "@@ -1 +1 @@\n+# not a comment in Go\n"
+        assert not is_trivial_patch(patch, "go")
+
+    def test_triple_plus_inside_hunk_is_a_change(self) -> None:
+        patch = HEADER + "@@ -1 +1,2 @@\n int i;\n+++i;\n"
+        assert not is_trivial_patch(patch, "c")
+
+    def test_triple_minus_inside_hunk_is_a_change(self) -> None:
+        patch = HEADER + "@@ -1,2 +1 @@\n int i;\n---i;\n"
+        assert not is_trivial_patch(patch, "c")
+
+    def test_continuation_line_starting_with_star(self) -> None:
+        patch = HEADER + "@@ -1,2 +1,2 @@\n x = (a + b)\n-    * scale);\n+    * factor);\n"
+        assert not is_trivial_patch(patch, "c")
+
+    @pytest.mark.parametrize(
+        ("extension", "removed", "added"),
+        [
+            ("go", "//go:build linux", "//go:build darwin"),
+            ("go", "// +build linux", "// +build darwin"),
+            ("py", "#!/usr/bin/env python2", "#!/usr/bin/env python3"),
+            ("sh", "#!/bin/sh", "#!/bin/bash"),
+            ("ts", "// eslint-disable-next-line no-console", "// eslint-disable-next-line"),
+            ("ts", "", "// @ts-expect-error"),
+        ],
+    )
+    def test_directive_comment_change(self, extension: str, removed: str, added: str) -> None:
+        patch = HEADER + f"@@ -1 +1 @@\n-{removed}\n+{added}\n"
+        assert not is_trivial_patch(patch, extension)
+
+    @pytest.mark.parametrize("pragma", ["# type: ignore", "# noqa: E501", "# pragma: no cover"])
+    def test_added_python_pragma(self, pragma: str) -> None:
+        patch = HEADER + f"@@ -1 +1,2 @@\n x = f()\n+{pragma}\n"
+        assert not is_trivial_patch(patch, "py")
+
+    def test_markdown_markup_only(self) -> None:
+        patch = HEADER + "@@ -1,2 +1,2 @@\n # Title\n+---\n-***\n+| --- | --- |\n"
+        assert is_trivial_patch(patch, "md")
+
+    def test_markdown_text_change(self) -> None:
+        patch = HEADER + "@@ -1 +1 @@\n-Old text\n+New text\n"
+        assert not is_trivial_patch(patch, "md")
+
+
+class TestCompactPatch:
+    def test_drops_context_and_keeps_line_numbers(self) -> None:
+        patch = HEADER + (
+            "@@ -10,7 +10,7 @@ def f():\n"
+            " a\n"
+            " b\n"
+            "-c\n"
+            "+C\n"
+            " d\n"
+            " e\n"
+            "-f\n"
+            "+F\n"
+        )
+        assert compact_patch(patch) == HEADER + (
+            "@@ -12 +12 @@ def f():\n"
+            "-c\n"
+            "+C\n"
+            "@@ -15 +15 @@\n"
+            "-f\n"
+            "+F"
+        )
+
+    def test_adjacent_changes_share_a_header(self) -> None:
+        patch = HEADER + "@@ -1,2 +1,3 @@\n-a\n+A\n+B\n"
+        assert compact_patch(patch) == HEADER + "@@ -1 +1 @@\n-a\n+A\n+B"
+
+    def test_no_newline_marker_follows_its_line(self) -> None:
+        patch = HEADER + "@@ -1 +1 @@\n-a\n\\ No newline at end of file\n+b\n"
+        assert compact_patch(patch) == HEADER + (
+            "@@ -1 +1 @@\n-a\n\\ No newline at end of file\n+b"
+        )
+
+    def test_dropped_marker_after_context(self) -> None:
+        patch = HEADER + "@@ -1,2 +1,2 @@\n-a\n+b\n c\n\\ No newline at end of file\n"
+        assert compact_patch(patch) == HEADER + "@@ -1 +1 @@\n-a\n+b"
+
+
+class TestRunAsync:
+    def test_without_running_loop(self) -> None:
+        async def answer() -> int:
+            return 42
+
+        assert run_async(answer()) == 42
+
+    @pytest.mark.asyncio
+    async def test_inside_running_loop(self) -> None:
+        caller = threading.current_thread()
+        var: contextvars.ContextVar[str] = contextvars.ContextVar("var", default="unset")
+        var.set("caller")
+
+        async def probe() -> tuple[threading.Thread, str]:
+            await asyncio.sleep(0)
+            return threading.current_thread(), var.get()
+
+        thread, value = run_async(probe())
+        assert thread is not caller
+        assert value == "caller"
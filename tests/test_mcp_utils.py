@@ -0,0 +1,148 @@
+"""Tests for the pooled MCP connection holder."""
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from codespy.tools import mcp_utils
+from codespy.tools.mcp_utils import MCPToolPool
+
+
+class FakeServers:
+    """Stands in for connect_mcp_server: records connections and cleanups."""
+
+    def __init__(self) -> None:
+        self.created: list[Any] = []
+        self.cleaned: list[tuple[list[Any], str]] = []
+        self.fail = False
+
+    async def create_tools(self, key: Any) -> tuple[list[Any], list[Any]]:
+        if self.fail:
+            raise RuntimeError(f"cannot connect {key}")
+        self.created.append(key)
+        return [f"tool:{key}"], [f"context:{key}:{len(self.created)}"]
+
+    async def cleanup(self, contexts: list[Any]) -> None:
+        self.cleaned.append((contexts, threading.current_thread().name))
+
+
+@pytest.fixture
+def servers(monkeypatch) -> FakeServers:
+    fake = FakeServers()
+    monkeypatch.setattr(mcp_utils, "cleanup_mcp_contexts", fake.cleanup)
+    return fake
+
+
+@pytest.fixture
+def owner_loop():
+    """Event loop running in another thread, like a BackgroundLoop."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="owner-loop", daemon=True)
+    thread.start()
+    yield loop
+    if loop.is_running():
+        loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    # Finish holder tasks a test left behind (e.g., after stopping the loop)
+    tasks = asyncio.all_tasks(loop)
+    if tasks:
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    loop.close()
+
+
+def test_reuses_connection_per_key(servers: FakeServers) -> None:
+    pool = MCPToolPool(servers.create_tools)
+
+    async def scenario() -> None:
+        first = await pool.get("a")
+        assert await pool.get("a") is first
+        assert await pool.get("b") == ["tool:b"]
+        assert servers.created == ["a", "b"]
+        assert servers.cleaned == []
+        await pool.aclose()
+
+    asyncio.run(scenario())
+    assert sorted(contexts for contexts, _ in servers.cleaned) == [
+        ["context:a:1"],
+        ["context:b:2"],
+    ]
+
+
+def test_concurrent_gets_share_one_connection(servers: FakeServers) -> None:
+    pool = MCPToolPool(servers.create_tools)
+
+    async def scenario() -> None:
+        first, second = await asyncio.gather(pool.get("a"), pool.get("a"))
+        assert first is second
+        await pool.aclose()
+
+    asyncio.run(scenario())
+    assert servers.created == ["a"]
+
+
+def test_failed_connection_is_retried(servers: FakeServers) -> None:
+    pool = MCPToolPool(servers.create_tools)
+
+    async def scenario() -> None:
+        servers.fail = True
+        with pytest.raises(RuntimeError):
+            await pool.get("a")
+        servers.fail = False
+        assert await pool.get("a") == ["tool:a"]
+        await pool.aclose()
+
+    asyncio.run(scenario())
+    assert servers.created == ["a"]
+
+
+def test_release_shuts_down_one_key(servers: FakeServers) -> None:
+    pool = MCPToolPool(servers.create_tools)
+
+    async def scenario() -> None:
+        await pool.get("a")
+        await pool.get("b")
+        await pool.release("a")
+        await pool.release("missing")
+        assert servers.cleaned == [(["context:a:1"], "MainThread")]
+        assert await pool.get("a") == ["tool:a"]
+        await pool.aclose()
+
+    asyncio.run(scenario())
+    assert servers.created == ["a", "b", "a"]
+
+
+def test_aclose_releases_on_owner_loop(servers: FakeServers, owner_loop) -> None:
+    pool = MCPToolPool(servers.create_tools)
+    asyncio.run_coroutine_threadsafe(pool.get("a"), owner_loop).result(timeout=5)
+
+    asyncio.run(pool.aclose())
+    assert servers.cleaned == [(["context:a:1"], "owner-loop")]
+
+
+def test_loop_change_releases_stale_connections(servers: FakeServers, owner_loop) -> None:
+    pool = MCPToolPool(servers.create_tools)
+    asyncio.run_coroutine_threadsafe(pool.get("a"), owner_loop).result(timeout=5)
+
+    async def scenario() -> None:
+        assert await pool.get("a") == ["tool:a"]
+        assert servers.cleaned == [(["context:a:1"], "owner-loop")]
+        await pool.aclose()
+
+    asyncio.run(scenario())
+    assert servers.created == ["a", "a"]
+    assert servers.cleaned[-1] == (["context:a:2"], "MainThread")
+
+
+def test_stopped_owner_loop_does_not_hang(servers: FakeServers, owner_loop, caplog) -> None:
+    pool = MCPToolPool(servers.create_tools)
+    asyncio.run_coroutine_threadsafe(pool.get("a"), owner_loop).result(timeout=5)
+    owner_loop.call_soon_threadsafe(owner_loop.stop)
+    while owner_loop.is_running():
+        threading.Event().wait(0.01)
+
+    asyncio.run(pool.aclose())
+    assert "event loop is not running" in caplog.text
@@ -0,0 +1,68 @@
+"""Tests for the supply chain auditor's MCP server lifecycle."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from codespy.agents.reviewer.models import ScopeResult, ScopeType
+from codespy.agents.reviewer.modules import supply_chain_auditor
+from codespy.agents.reviewer.modules.helpers import resolve_scope_root
+from codespy.agents.reviewer.modules.supply_chain_auditor import (
+    OSV_MCP_SERVER,
+    SupplyChainAuditor,
+)
+from codespy.config import Settings
+from codespy.tools import mcp_utils
+from codespy.tools.git.models import ChangedFile, FileStatus
+
+
+def make_scope(subroot: str) -> ScopeResult:
+    return ScopeResult(
+        subroot=subroot,
+        scope_type=ScopeType.SERVICE,
+        has_changes=True,
+        reason="test",
+        changed_files=[
+            ChangedFile(
+                filename=f"{subroot}/Dockerfile",
+                status=FileStatus.MODIFIED,
+                patch="+FROM python:3.12\n",
+            )
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_scoped_servers_released_after_last_scope(monkeypatch, tmp_path: Path) -> None:
+    live: set[tuple[str, Path]] = set()
+    snapshots: list[set[Path]] = []
+
+    async def connect(server: Path, roots: list[str], contexts: list[Any], _: str) -> list[Any]:
+        key = (roots[0] if roots else "", server)
+        live.add(key)
+        contexts.append(key)
+        return []
+
+    async def cleanup(contexts: list[Any]) -> None:
+        live.difference_update(contexts)
+
+    monkeypatch.setattr(supply_chain_auditor, "connect_mcp_server", connect)
+    monkeypatch.setattr(mcp_utils, "cleanup_mcp_contexts", cleanup)
+    monkeypatch.setattr(Settings, "get_max_parallel_scopes", lambda self, name: 1)
+    auditor = SupplyChainAuditor()
+
+    async def audit(
+        scope: ScopeResult, repo_path: Path, osv_tools: list[Any], max_iters: int
+    ) -> list[Any]:
+        await auditor._get_scoped_tools(resolve_scope_root(repo_path, scope.subroot))
+        snapshots.append({Path(root) for root, server in live if server != OSV_MCP_SERVER})
+        return []
+
+    monkeypatch.setattr(auditor, "_audit_scope", audit)
+    scopes = [make_scope("a"), make_scope("a"), make_scope("b")]
+    assert await auditor.aforward(scopes, tmp_path) == []
+    assert snapshots == [{tmp_path / "a"}, {tmp_path / "a"}, {tmp_path / "b"}]
+    assert live == {("", OSV_MCP_SERVER)}
+    await auditor.aclose()
+    assert live == set()